@@ -0,0 +1,196 @@
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from stub_server import GeekNewsStub
+
+CRAWL_STAGES = ["list_fetch", "parse_list", "detail_fetch", "parse_detail", "summarize", "total"]
+
+
+def peak_rss_mb():
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def summarize_rounds(rounds):
+    stages = {}
+    for stage in CRAWL_STAGES:
+        samples = [run["stages"][stage] for run in rounds if stage in run["stages"]]
+        if not samples:
+            continue
+        seconds = [sample["seconds"] for sample in samples]
+        wall_seconds = [sample["wall_seconds"] for sample in samples]
+        stages[stage] = {
+            "count": samples[-1]["count"],
+            "wall_ms": round(statistics.mean(wall_seconds) * 1000, 1),
+            "mean_ms": round(statistics.mean(seconds) * 1000, 1),
+            "min_ms": round(min(seconds) * 1000, 1),
+            "max_ms": round(max(seconds) * 1000, 1),
+            "per_call_ms": round(statistics.mean(seconds) / samples[-1]["count"] * 1000, 2)
+        }
+    return stages
+
+
+async def run_crawl_rounds(fetcher, rounds):
+    results = []
+    for number in range(rounds):
+        started = time.perf_counter()
+        items = await fetcher.fetch_news()
+        elapsed = time.perf_counter() - started
+        results.append({
+            "round": number + 1,
+            "items": len(items),
+            "seconds": round(elapsed, 3),
+            "items_per_second": round(len(items) / elapsed, 2) if elapsed else None,
+            "stages": {stage: dict(timing) for stage, timing in fetcher.stage_timings.items()},
+            "peak_rss_mb": peak_rss_mb()
+        })
+        print(f"[BENCH] 크롤링 {number + 1}/{rounds}: {len(items)}개, {elapsed:.2f}s")
+    return results, items
+
+
+async def run_export(server, news_items, combine_format):
+    from utils.cards import build_card_pages
+
+    session_id = f"bench-{datetime.now().strftime('%H%M%S')}"
+    pages = [{**page, "export_format": "png", "session_id": session_id} for page in build_card_pages(news_items)]
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        started = time.perf_counter()
+        try:
+            await server.browser_pool.start()
+            browser = {"seconds": round(time.perf_counter() - started, 3)}
+        except Exception as e:
+            browser = {"error": str(e)}
+
+        started = time.perf_counter()
+        response = await client.post("/api/export/batch", json={"items": pages})
+        render_seconds = time.perf_counter() - started
+        batch = response.json()
+        artifacts = batch.get("artifacts", [])
+        methods = sorted({artifact.get("method", "browser") for artifact in artifacts if artifact.get("status") == "success"})
+
+        started = time.perf_counter()
+        response = await client.post("/api/export/combine-images", json={"session_id": session_id, "output_format": combine_format})
+        combine_seconds = time.perf_counter() - started
+        combined = response.json()
+
+    await server.browser_pool.close()
+    return {
+        "browser_start": browser,
+        "render": {
+            "pages": len(pages),
+            "failed": batch.get("failed"),
+            "methods": methods,
+            "seconds": round(render_seconds, 3),
+            "pages_per_second": round(len(pages) / render_seconds, 2) if render_seconds else None
+        },
+        "combine": {
+            "format": combine_format,
+            "seconds": round(combine_seconds, 3),
+            "width": combined.get("width"),
+            "height": combined.get("height"),
+            "error": combined.get("detail")
+        },
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+async def run_benchmark(args, stub):
+    from config import AI_CONFIG, CRAWLING_CONFIG, SUMMARY_CACHE_CONFIG
+    CRAWLING_CONFIG["base_url"] = stub.base_url
+    CRAWLING_CONFIG["news_count"] = args.news_count
+    SUMMARY_CACHE_CONFIG["enabled"] = args.summary_cache
+
+    import server
+    if args.api_type not in server.fetchers:
+        raise SystemExit(f"[BENCH] 지원하지 않는 API 타입: {args.api_type}. 사용 가능: {list(server.fetchers.keys())}")
+    fetcher = server.fetchers[args.api_type]
+
+    started = time.perf_counter()
+    try:
+        await fetcher.warm_up()
+        model = {"seconds": round(time.perf_counter() - started, 3), "load_timings": fetcher.load_timings}
+    except Exception as e:
+        model = {"error": str(e)}
+
+    rounds, news_items = await run_crawl_rounds(fetcher, args.rounds)
+    report = {
+        "measured_at": datetime.now().isoformat(),
+        "settings": {
+            "api_type": args.api_type,
+            "news_count": args.news_count,
+            "rounds": args.rounds,
+            "stub_latency_ms": args.latency_ms,
+            "summary_cache": args.summary_cache,
+            "detail_concurrency": CRAWLING_CONFIG["detail_concurrency"],
+            "batch_size": AI_CONFIG["batch_size"],
+            "quantization": AI_CONFIG["quantization"]
+        },
+        "model": model,
+        "crawl": {
+            "stages": summarize_rounds(rounds),
+            "items_per_second": round(statistics.mean(run["items_per_second"] or 0 for run in rounds), 2),
+            "stub_requests": dict(stub.requests),
+            "inference": fetcher.inference_stats(),
+            "rounds": rounds
+        }
+    }
+    if not args.skip_export:
+        report["export"] = await run_export(server, news_items, args.combine_format)
+    fetcher.close()
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 GeekNews 대역 서버로 크롤링, 요약, 내보내기, 이미지 결합 단계를 오프라인에서 측정합니다.")
+    parser.add_argument("--api-type", default="huggingface", help="server.fetchers에 등록된 API 타입")
+    parser.add_argument("--news-count", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3, help="크롤링 반복 횟수 (첫 회도 모델 로딩 이후 측정)")
+    parser.add_argument("--latency-ms", type=int, default=0, help="대역 서버 응답마다 더할 지연 시간")
+    parser.add_argument("--summary-cache", action="store_true", help="요약 캐시 사용 (기본값: 끔, 매번 추론)")
+    parser.add_argument("--combine-format", default="png", choices=["png", "jpeg", "webp"])
+    parser.add_argument("--skip-export", action="store_true", help="렌더링/결합 단계 생략")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="geeknews-bench-"))
+    os.chdir(workdir)
+    try:
+        with GeekNewsStub(latency_ms=args.latency_ms) as stub:
+            print(f"[BENCH] 대역 서버: {stub.base_url}, 작업 디렉터리: {workdir}")
+            report = asyncio.run(run_benchmark(args, stub))
+    finally:
+        os.chdir(ROOT_DIR)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / f"e2e_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    for stage, entry in report["crawl"]["stages"].items():
+        print(f"[BENCH] {stage}: 경과 {entry['wall_ms']}ms ({entry['count']}회, 회당 {entry['per_call_ms']}ms)")
+    print(f"[BENCH] 처리량: {report['crawl']['items_per_second']} items/s")
+    if "export" in report:
+        export = report["export"]
+        print(f"[BENCH] 렌더링: {export['render']['pages']}페이지 {export['render']['seconds']}s ({', '.join(export['render']['methods']) or '-'}), 결합: {export['combine']['seconds']}s")
+    print(f"[BENCH] 최대 RSS: {report['peak_rss_mb']}MB")
+    print(f"[SUCCESS] 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+sys.path.insert(0, str(ROOT_DIR))
+
+from utils.extract import GEEKNEWS_ORIGIN, parse_topic_detail, parse_topic_list
+
+
+def soup_topic_list(html, limit):
+    soup = BeautifulSoup(html, "lxml")
+    entries = []
+    for topic in soup.find_all("div", class_="topic_row")[:limit]:
+        title_elem = topic.find("div", class_="topictitle")
+        title_link = title_elem.find("a") if title_elem else None
+        if not title_link:
+            continue
+        topic_id = None
+        geeknews_link = ""
+        for link in topic.find_all("a"):
+            href = link.get("href", "")
+            if "topic?id=" in href:
+                topic_id = href.split("id=")[-1].split("&")[0]
+                geeknews_link = urljoin(GEEKNEWS_ORIGIN, href)
+                break
+        desc_elem = topic.find(class_="topicdesc")
+        entries.append({
+            "index": len(entries),
+            "id": topic_id or f"item-{len(entries)}",
+            "topic_id": topic_id,
+            "title": title_link.text.strip(),
+            "desc": desc_elem.text.strip() if desc_elem else "",
+            "source_url": urljoin(GEEKNEWS_ORIGIN, title_link.get("href", "")),
+            "discussion_url": geeknews_link,
+        })
+    return entries
+
+
+def soup_topic_detail(html):
+    soup = BeautifulSoup(html, "lxml")
+    contents_elem = soup.find("div", class_="topic_contents")
+    if contents_elem:
+        return contents_elem.get_text(separator=" ", strip=True)
+    desc_elem = soup.find("div", class_="topic_desc")
+    return desc_elem.get_text(strip=True) if desc_elem else ""
+
+
+def measure(parse, html, iterations):
+    parse(html)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        parse(html)
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    parse(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    timings.sort()
+    return {
+        "mean_ms": round(statistics.mean(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "peak_alloc_kb": round(peak / 1024, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록/상세 페이지 HTML 파싱 시간과 메모리를 BeautifulSoup과 lxml 추출 경로로 비교합니다.")
+    parser.add_argument("--iterations", type=int, default=200, help="페이지당 반복 횟수")
+    parser.add_argument("--limit", type=int, default=30, help="목록에서 읽을 토픽 수")
+    args = parser.parse_args()
+
+    list_html = (FIXTURES_DIR / "geeknews_list.html").read_text(encoding="utf-8")
+    topic_html = (FIXTURES_DIR / "geeknews_topic.html").read_text(encoding="utf-8")
+    cases = {
+        "topic_list": (list_html, lambda html: soup_topic_list(html, args.limit), lambda html: parse_topic_list(html, args.limit)),
+        "topic_detail": (topic_html, soup_topic_detail, parse_topic_detail)
+    }
+
+    report = {"measured_at": datetime.now().isoformat(), "iterations": args.iterations, "pages": {}}
+    for page, (html, soup_parse, lxml_parse) in cases.items():
+        if soup_parse(html) != lxml_parse(html):
+            raise SystemExit(f"[ERROR] {page}: 두 파서의 추출 결과가 다릅니다.")
+        print(f"[BENCH] {page} 측정 중 ({len(html.encode('utf-8')) // 1024}KB)...")
+        soup_result = measure(soup_parse, html, args.iterations)
+        lxml_result = measure(lxml_parse, html, args.iterations)
+        report["pages"][page] = {
+            "html_kb": round(len(html.encode("utf-8")) / 1024, 1),
+            "beautifulsoup": soup_result,
+            "lxml": lxml_result,
+            "speedup": round(soup_result["mean_ms"] / lxml_result["mean_ms"], 1)
+        }
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / f"parse_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    for page, entry in report["pages"].items():
+        print(
+            f"[BENCH] {page}: BeautifulSoup {entry['beautifulsoup']['mean_ms']}ms / {entry['beautifulsoup']['peak_alloc_kb']}KB, "
+            f"lxml {entry['lxml']['mean_ms']}ms / {entry['lxml']['peak_alloc_kb']}KB ({entry['speedup']}배)"
+        )
+    print(f"[SUCCESS] 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+MODES = {"fp32": None, "int8": "int8"}
+
+
+def rouge_l(candidate, reference):
+    candidate_tokens = candidate.split()
+    reference_tokens = reference.split()
+    if not candidate_tokens or not reference_tokens:
+        return 0.0
+    previous = [0] * (len(reference_tokens) + 1)
+    for token in candidate_tokens:
+        current = [0]
+        for j, reference_token in enumerate(reference_tokens):
+            current.append(previous[j] + 1 if token == reference_token else max(previous[j + 1], current[j]))
+        previous = current
+    lcs = previous[-1]
+    if lcs == 0:
+        return 0.0
+    precision = lcs / len(candidate_tokens)
+    recall = lcs / len(reference_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def run_worker(mode, threads, limit):
+    sys.path.insert(0, str(ROOT_DIR))
+    from config import AI_CONFIG
+    from generator import NewsFetcher
+    AI_CONFIG["quantization"] = MODES[mode]
+    AI_CONFIG["num_threads"] = threads
+    topics = json.loads((FIXTURES_DIR / "topics.json").read_text(encoding="utf-8"))[:limit]
+    fetcher = NewsFetcher(api_type="huggingface")
+    fetcher.summary_cache = None
+    fetcher.ensure_ready()
+    fetcher._generate_summaries([topics[0]["text"]])
+    latencies = []
+    summaries = []
+    for topic in topics:
+        started = time.perf_counter()
+        summaries.append(fetcher._generate_summaries([topic["text"]])[0])
+        latencies.append((time.perf_counter() - started) * 1000)
+    fetcher.close()
+    print(json.dumps({
+        "mode": mode,
+        "load_timings": fetcher.load_timings,
+        "latencies_ms": latencies,
+        "summaries": summaries,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }, ensure_ascii=False))
+
+
+def spawn_worker(mode, threads, limit):
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", mode, "--threads", str(threads), "--limit", str(limit)],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        raise RuntimeError(f"{mode} 측정 실패: {result.stderr.strip()[-500:]}")
+    return json.loads(lines[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fp32와 int8 양자화 요약 모델의 지연 시간, 메모리, 요약 유사도를 비교합니다.")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--threads", type=int, default=0, help="torch 스레드 수 (0이면 기본값)")
+    parser.add_argument("--limit", type=int, default=8, help="사용할 고정 토픽 수")
+    parser.add_argument("--worker", choices=list(MODES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.threads, args.limit)
+        return
+
+    runs = {}
+    for mode in args.modes:
+        print(f"[BENCH] {mode} 모델 측정 중...")
+        runs[mode] = spawn_worker(mode, args.threads, args.limit)
+
+    report = {"measured_at": datetime.now().isoformat(), "threads": args.threads, "modes": {}}
+    reference = runs.get("fp32")
+    for mode, run in runs.items():
+        latencies = run["latencies_ms"]
+        entry = {
+            "load_timings": run["load_timings"],
+            "latency_ms": {
+                "mean": round(statistics.mean(latencies), 1),
+                "median": round(statistics.median(latencies), 1),
+                "max": round(max(latencies), 1)
+            },
+            "peak_rss_mb": run["peak_rss_mb"],
+            "summaries": run["summaries"]
+        }
+        if reference and mode != "fp32":
+            scores = [rouge_l(candidate, expected) for candidate, expected in zip(run["summaries"], reference["summaries"])]
+            entry["similarity_to_fp32"] = {"rouge_l_mean": round(statistics.mean(scores), 3), "rouge_l_min": round(min(scores), 3)}
+        report["modes"][mode] = entry
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / f"quantization_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    for mode, entry in report["modes"].items():
+        print(f"[BENCH] {mode}: 평균 {entry['latency_ms']['mean']}ms, 최대 RSS {entry['peak_rss_mb']}MB, 유사도 {entry.get('similarity_to_fp32', '-')}")
+    print(f"[SUCCESS] 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+HEAVY_MODULES = ["generator", "server", "torch", "transformers", "playwright.async_api", "PIL.Image"]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+try:
+    __import__(sys.argv[1])
+    print(json.dumps({"seconds": time.perf_counter() - started}))
+except Exception as e:
+    print(json.dumps({"error": str(e)}))
+"""
+
+MODEL_SNIPPET = """
+import json
+from generator import NewsFetcher
+fetcher = NewsFetcher(api_type="huggingface")
+fetcher.ensure_ready()
+print(json.dumps(fetcher.load_timings))
+fetcher.close()
+"""
+
+
+def run_python(code, *args, env=None):
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT_DIR, capture_output=True, text=True, env=env
+    )
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        return {"error": (result.stderr.strip().splitlines() or ["출력 없음"])[-1]}
+    return json.loads(lines[-1])
+
+
+def measure_imports():
+    return {module: run_python(IMPORT_SNIPPET, module) for module in HEAVY_MODULES}
+
+
+def measure_time_to_healthy(timeout):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    env = {**os.environ, "MODEL_WARMUP": "false"}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+                if response.status_code == 200:
+                    return {
+                        "seconds": round(time.perf_counter() - started, 3),
+                        "startup_timings": response.json().get("startup_timings")
+                    }
+            except httpx.HTTPError:
+                pass
+            if process.poll() is not None:
+                return {"error": f"서버 프로세스 종료 (code={process.returncode})"}
+            time.sleep(0.05)
+        return {"error": f"{timeout}초 안에 헬스체크 응답 없음"}
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 시작 시간과 모델 로딩 시간을 측정합니다.")
+    parser.add_argument("--skip-model", action="store_true", help="모델 로딩 측정을 건너뜁니다")
+    parser.add_argument("--timeout", type=float, default=60, help="헬스체크 대기 시간 (초)")
+    args = parser.parse_args()
+
+    print("[BENCH] 모듈 임포트 시간 측정 중...")
+    results = {
+        "measured_at": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "imports": measure_imports()
+    }
+    print("[BENCH] 헬스체크 응답까지 걸리는 시간 측정 중...")
+    results["time_to_healthy"] = measure_time_to_healthy(args.timeout)
+    if not args.skip_model:
+        print("[BENCH] 모델 로딩 시간 측정 중...")
+        results["model_load"] = run_python(MODEL_SNIPPET)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    output = RESULTS_DIR / f"startup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    print(f"[SUCCESS] 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+class GeekNewsStub:
+    """저장된 목록/상세 HTML을 돌려주는 로컬 GeekNews 대역 서버입니다."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, fixtures_dir=FIXTURES_DIR):
+        self.list_html = (fixtures_dir / "geeknews_list.html").read_text(encoding="utf-8").encode("utf-8")
+        self.topic_html = (fixtures_dir / "geeknews_topic.html").read_text(encoding="utf-8")
+        self.latency = latency_ms / 1000
+        self.requests = {"list": 0, "topic": 0}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def topic_page(self, topic_id):
+        marker = "<div class=topic_contents>"
+        return self.topic_html.replace(marker, f"{marker}<p>토픽 {topic_id}</p>", 1).encode("utf-8")
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/":
+                    stub.requests["list"] += 1
+                    body = stub.list_html
+                elif url.path == "/topic":
+                    stub.requests["topic"] += 1
+                    body = stub.topic_page(parse_qs(url.query).get("id", [""])[0])
+                else:
+                    self.send_error(404)
+                    return
+                if stub.latency:
+                    time.sleep(stub.latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="geeknews-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmarks/fixtures의 HTML로 GeekNews 목록/상세 페이지를 흉내 내는 로컬 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=0, help="응답마다 더할 지연 시간")
+    args = parser.parse_args()
+    stub = GeekNewsStub(port=args.port, latency_ms=args.latency_ms)
+    print(f"[STUB] GeekNews 대역 서버 실행 중: {stub.base_url} (CRAWLING_CONFIG['base_url']로 지정)")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,14 @@
 CRAWLING_CONFIG = {
     "news_count": 5,  # 가져올 뉴스 개수
     "base_url": "https://news.hada.io/",
-    "timeout": 10  # HTTP 요청 타임아웃 (초)
+    "timeout": 10,  # HTTP 요청 타임아웃 (초)
+    "detail_concurrency": 5,  # 동시에 가져올 상세 페이지 수
+    "max_connections": 10,  # 공유 커넥션 풀 전체 최대 연결 수
+    "max_keepalive_connections": 5,  # 유지할 keep-alive 연결 수
+    "max_connections_per_host": 4,  # 호스트별 동시 요청 수
+    "retries": 2,  # 네트워크 오류/5xx 응답 시 재시도 횟수
+    "retry_backoff": 0.5,  # 재시도 간격 기본값 (초, 지수 증가)
+    "http2": False  # HTTP/2 사용 여부 (h2 패키지 필요)
 }
 
 # AI 모델 설정
@@ -12,7 +19,90 @@ AI_CONFIG = {
     "max_output_length": 256,
     "min_output_length": 50,
     "length_penalty": 2.0,
-    "num_beams": 4
+    "num_beams": 4,
+    "batch_size": 8,  # 한 번의 generate 호출로 요약할 최대 항목 수
+    "batch_wait_ms": 20,  # 마이크로배치를 모으기 위해 대기하는 최대 시간
+    "queue_size": 64,  # 추론 대기열 최대 길이 (가득 차면 요청이 대기)
+    "queue_timeout": 60,  # 대기열에 자리가 날 때까지 기다리는 최대 시간 (초)
+    "quantization": None,  # None 또는 "int8" (CPU 전용 동적 양자화)
+    "num_threads": 0,  # CPU 추론 스레드 수 (0이면 torch 기본값)
+    "inference_mode": True,  # torch.inference_mode 사용 여부 (False면 no_grad)
+    # 모델 사이드카(python -m utils.model_server) 주소. 지정하면 API 워커는 모델을 올리지 않고 요약만 요청
+    # 예: "http://127.0.0.1:8001" 또는 "unix:///tmp/geeknews-inference.sock" (환경 변수 INFERENCE_SERVER_URL 우선)
+    "inference_url": None,
+    "inference_timeout": 120  # 사이드카 요약 요청 타임아웃 (초)
+}
+
+# 지연 시간 예산 기반 적응형 디코딩 (켜면 항목마다 빔 수/입력 길이/출력 길이를 예산과 측정 처리량에 맞춰 선택)
+ADAPTIVE_DECODING_CONFIG = {
+    "enabled": False,
+    "crawl_budget_seconds": 120,  # 크롤링 한 번의 요약 시간 예산 (None이면 제한 없음)
+    "item_budget_seconds": None,  # 항목 하나의 시간 예산 (None이면 제한 없음)
+    # 품질이 높은 순서. 첫 단계는 AI_CONFIG 기본값과 같고, 마지막 단계는 greedy
+    "levels": [
+        {"num_beams": 4, "max_input_length": 1024, "max_output_length": 256, "min_output_length": 50},
+        {"num_beams": 2, "max_input_length": 768, "max_output_length": 192, "min_output_length": 40},
+        {"num_beams": 1, "max_input_length": 512, "max_output_length": 128, "min_output_length": 30},
+        {"num_beams": 1, "max_input_length": 256, "max_output_length": 64, "min_output_length": 16}
+    ],
+    "decode_weight": 4.0,  # 출력 토큰 하나(빔당)가 입력 토큰 하나보다 비싼 정도
+    "ewma_alpha": 0.3,  # 처리량 추정치 갱신 비율
+    "output_ratio": 0.5,  # 입력 토큰 대비 출력 길이 상한
+    "length_step": 32  # 출력 길이 상한을 이 단위로 맞춰 같은 계획끼리 배치
+}
+
+# 요약 캐시 설정 (토픽 id + 원문 해시 + 모델/생성 설정 기준)
+SUMMARY_CACHE_CONFIG = {
+    "enabled": True,
+    "path": "./data/summary_cache.sqlite3",
+    "max_entries": 2000  # 초과 시 가장 오래 사용되지 않은 요약부터 삭제
+}
+
+# data/saved_states 스냅샷 보관 정책 (종류별로 최신 keep개, max_age_days보다 오래된 것은 삭제, 가장 최신 1개는 항상 유지)
+SNAPSHOT_RETENTION = {
+    "state": {"keep": 200, "max_age_days": None},
+    "auto_crawled": {"keep": 60, "max_age_days": 90},
+    "manual_refresh": {"keep": 30, "max_age_days": 30}
+}
+
+# PATCH /api/state 로 쌓인 변경분을 전체 스냅샷으로 합치는 기준 (둘 중 하나를 넘으면 백그라운드에서 압축)
+STATE_LOG_CONFIG = {
+    "path": "./data/saved_states/state_log.sqlite3",
+    "compact_every": 50,  # 마지막 스냅샷 이후 patch 수
+    "compact_bytes": 256 * 1024  # 마지막 스냅샷 이후 patch 크기 합
+}
+
+# uvicorn --workers N 으로 띄울 때 워커 간 뉴스 캐시 공유와 스케줄러 리더 선출
+SHARED_CACHE_CONFIG = {
+    "enabled": True,
+    "path": "./data/shared_cache.sqlite3",
+    "lock_dir": "./data/locks",
+    "leader_poll_interval": 15  # 리더 워커가 죽었을 때 다른 워커가 스케줄러 잠금을 다시 시도하는 간격(초)
+}
+
+# 내보내기(Playwright) 설정
+EXPORT_CONFIG = {
+    "browser_pool_size": 2,  # 미리 만들어 두는 페이지 수 (= 동시 렌더링 수)
+    "viewport": {"width": 1080, "height": 1080},
+    "acquire_timeout": 30,  # 빈 페이지를 기다리는 최대 시간 (초)
+    "health_check_interval": 30  # 브라우저 상태 확인 주기 (초)
+}
+
+# 같은 HTML/형식/설정의 내보내기는 이전 결과 파일을 재사용
+RENDER_CACHE_CONFIG = {
+    "enabled": True,
+    "path": "./data/render_cache.sqlite3",
+    "max_bytes": 500 * 1024 * 1024,  # 초과 시 가장 오래 사용되지 않은 결과부터 삭제
+    "max_age_days": 7
+}
+
+# 정기 크롤링 직후 카드 이미지 미리 렌더링 (output/daily/YYYYMMDD/)
+PRERENDER_CONFIG = {
+    "enabled": False,
+    "output_dir": "./output/daily",
+    "combine_format": "png",  # 결합 이미지 형식: 'png'(스트리밍 저장), 'jpeg', 'webp'(전체 캔버스를 메모리에 만듦)
+    "combine_max_width": None,
+    "keep_days": 14  # 이 기간보다 오래된 날짜 디렉터리는 삭제
 }
 
 # S3 설정 (백업 및 공유용으로 유지)
@@ -1,27 +1,98 @@
 import os
 import asyncio
-from bs4 import BeautifulSoup
-from transformers import T5ForConditionalGeneration, AutoTokenizer
-import torch
-from config import CRAWLING_CONFIG, AI_CONFIG
+import hashlib
+import importlib.util
+import json
+import threading
+import time
+from urllib.parse import urljoin
+from config import CRAWLING_CONFIG, AI_CONFIG, ADAPTIVE_DECODING_CONFIG, SUMMARY_CACHE_CONFIG
+from utils.decoding import DecodingPlanner
+from utils.inference import InferenceExecutor
+from utils.summary_cache import SummaryCache
+from utils.extract import parse_topic_detail, parse_topic_list
+from utils.metrics import (
+    CRAWL_ITEMS, CRAWL_SECONDS, HTTP_FETCH_SECONDS, SUMMARIZE_SECONDS, SUMMARY_CACHE_REQUESTS, SUMMARY_DECODING_LEVELS,
+    SUMMARY_TOKENS
+)
 from dotenv import load_dotenv
 import httpx
-import openai
 
 load_dotenv()
 
+SUMMARY_FAILED_TEXT = "요약 생성에 실패했습니다."
+
 class NewsFetcher:
-    def __init__(self, api_type="huggingface"):
+    def __init__(self, api_type="huggingface", inference_url=None, use_summary_cache=True):
         self.api_type = api_type
-        if api_type == "huggingface":
-            self._init_huggingface_model()
-        elif api_type == "openai":
-            self._init_openai_client()
-        else:
+        # inference_url=""이면 설정과 관계없이 모델을 이 프로세스에 올립니다 (사이드카 자신이 사용)
+        if inference_url is None:
+            inference_url = os.getenv("INFERENCE_SERVER_URL") or AI_CONFIG["inference_url"]
+        self.inference_url = inference_url if api_type == "huggingface" else None
+        self._remote = None
+        self._remote_clients = []  # 이벤트 루프마다 만든 사이드카 클라이언트 (close에서 모두 닫음)
+        self._remote_stats = {"requests": 0, "texts": 0, "failures": 0}
+        self._host_limits = {}
+        self.list_validators = {}
+        self.last_crawl_stats = {}
+        self.stage_timings = {}
+        self._stage_started = {}
+        self.summary_cache = None
+        # 사이드카는 요약 캐시를 쓰지 않으므로 use_summary_cache=False로 SQLite 파일을 열지 않음
+        if use_summary_cache and SUMMARY_CACHE_CONFIG["enabled"]:
+            self.summary_cache = SummaryCache(SUMMARY_CACHE_CONFIG["path"], SUMMARY_CACHE_CONFIG["max_entries"])
+        if api_type not in ("huggingface", "openai"):
             raise ValueError(f"지원하지 않는 API 타입: {api_type}")
+        self.decoding = None
+        if api_type == "huggingface" and ADAPTIVE_DECODING_CONFIG["enabled"]:
+            self.decoding = DecodingPlanner.from_config(ADAPTIVE_DECODING_CONFIG)
+        self.warmup_state = "pending"
+        self.warmup_error = None
+        self.load_timings = {}
+        self._init_lock = threading.Lock()
+
+    def ensure_ready(self):
+        with self._init_lock:
+            if self.warmup_state == "ready":
+                return
+            self.warmup_state = "loading"
+            started = time.perf_counter()
+            try:
+                if self.inference_url:
+                    self._check_inference_server()
+                elif self.api_type == "huggingface":
+                    self._init_huggingface_model()
+                else:
+                    self._init_openai_client()
+            except Exception as e:
+                self.warmup_state = "failed"
+                self.warmup_error = str(e)
+                print(f"[ERROR] 요약 모델 초기화 실패: {e}")
+                raise
+            self.load_timings["total_seconds"] = round(time.perf_counter() - started, 3)
+            self.warmup_error = None
+            self.warmup_state = "ready"
+
+    async def warm_up(self):
+        if self.warmup_state != "ready":
+            await asyncio.to_thread(self.ensure_ready)
+
+    def warmup_status(self):
+        return {
+            "state": self.warmup_state,
+            "error": self.warmup_error,
+            "timings": self.load_timings
+        }
 
     def _init_huggingface_model(self):
         print("HuggingFace 요약 모델 로딩 중...")
+        started = time.perf_counter()
+        import torch
+        from transformers import T5ForConditionalGeneration, AutoTokenizer
+        self.load_timings["import_seconds"] = round(time.perf_counter() - started, 3)
+        if AI_CONFIG["num_threads"]:
+            torch.set_num_threads(AI_CONFIG["num_threads"])
+        started = time.perf_counter()
         hf_token = os.getenv('HUGGINGFACE_TOKEN')
         self.tokenizer = AutoTokenizer.from_pretrained(
             AI_CONFIG["model_name"], token=hf_token, trust_remote_code=True
@@ -31,48 +102,253 @@ class NewsFetcher:
         )
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.model.to(self.device)
+        self.model.eval()
+        if AI_CONFIG["quantization"] == "int8":
+            if self.device.type == "cpu":
+                self.model = torch.ao.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+                print("[MODEL] int8 동적 양자화 적용 완료")
+            else:
+                print("[MODEL] int8 동적 양자화는 CPU에서만 지원되어 건너뜁니다.")
+        elif AI_CONFIG["quantization"]:
+            raise ValueError(f"지원하지 않는 양자화 방식: {AI_CONFIG['quantization']}")
+        self.load_timings["model_load_seconds"] = round(time.perf_counter() - started, 3)
+        self.executor = InferenceExecutor(
+            self._generate_summaries,
+            max_batch_size=AI_CONFIG["batch_size"],
+            max_wait_ms=AI_CONFIG["batch_wait_ms"],
+            max_queue_size=AI_CONFIG["queue_size"],
+            submit_timeout=AI_CONFIG["queue_timeout"],
+            name="hf-summarizer"
+        )
+        self.executor.start()
         print("✓ HuggingFace 모델 로딩 완료")
 
+    def _remote_target(self):
+        if self.inference_url.startswith("unix://"):
+            return "http://model-server", {"uds": self.inference_url[len("unix://"):]}
+        return self.inference_url.rstrip("/"), {}
+
+    def _check_inference_server(self):
+        print(f"모델 서버 연결 확인 중: {self.inference_url}")
+        base_url, transport_options = self._remote_target()
+        with httpx.Client(transport=httpx.HTTPTransport(**transport_options), base_url=base_url, timeout=10) as client:
+            response = client.get("/health")
+        health = response.json()
+        if response.status_code != 200:
+            raise RuntimeError(f"모델 서버가 준비되지 않았습니다: {health.get('state')} {health.get('error') or ''}".strip())
+        self.load_timings["remote_model"] = health.get("model")
+        print(f"✓ 모델 서버 연결 완료 (pid={health.get('pid')})")
+
+    async def _remote_client(self):
+        loop = asyncio.get_running_loop()
+        if self._remote is None or self._remote[0] is not loop:
+            base_url, transport_options = self._remote_target()
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(**transport_options),
+                base_url=base_url,
+                timeout=AI_CONFIG["inference_timeout"]
+            )
+            self._remote = (loop, client)
+            # 이미 끝난 루프에서 만든 클라이언트는 새 클라이언트를 만들 때 닫음
+            stale = [entry for entry in self._remote_clients if entry[0].is_closed()]
+            self._remote_clients = [entry for entry in self._remote_clients if not entry[0].is_closed()]
+            self._remote_clients.append((loop, client))
+            for _, stale_client in stale:
+                await self._aclose_remote(stale_client)
+        return self._remote[1]
+
+    @staticmethod
+    async def _aclose_remote(client):
+        try:
+            await client.aclose()
+        except Exception as e:
+            print(f"[WARNING] 모델 서버 클라이언트 종료 실패: {e}")
+
+    async def _summarize_batch_remote(self, texts, budget_seconds=None):
+        self._remote_stats["requests"] += 1
+        self._remote_stats["texts"] += len(texts)
+        payload = {"texts": texts}
+        if budget_seconds is not None:
+            payload["budget_seconds"] = budget_seconds
+        try:
+            client = await self._remote_client()
+            response = await client.post("/summarize", json=payload)
+            response.raise_for_status()
+            body = response.json()
+            return body["summaries"], body.get("levels") or [0] * len(texts)
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            self._remote_stats["failures"] += 1
+            print(f"  [모델 서버 요약 실패] 오류: {e}")
+            return [SUMMARY_FAILED_TEXT] * len(texts), [0] * len(texts)
+
     def _init_openai_client(self):
         print("OpenAI API 초기화 중...")
+        started = time.perf_counter()
+        import openai
+        self.load_timings["import_seconds"] = round(time.perf_counter() - started, 3)
         self.openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         print("✓ OpenAI API 초기화 완료")
 
+    def inference_stats(self):
+        decoding = {"decoding": self.decoding.status()} if self.decoding else {}
+        if self.inference_url:
+            return {"mode": "remote", "url": self.inference_url, **self._remote_stats, **decoding}
+        executor = getattr(self, "executor", None)
+        return {**executor.stats(), **decoding} if executor else None
+
+    def summary_cache_stats(self):
+        return self.summary_cache.info() if self.summary_cache else None
+
+    async def aclose(self):
+        """현재 루프나 이미 끝난 루프에서 만든 사이드카 클라이언트를 닫은 뒤 close()를 호출합니다."""
+        loop = asyncio.get_running_loop()
+        remaining = []
+        for client_loop, client in self._remote_clients:
+            if client_loop is loop or client_loop.is_closed():
+                await self._aclose_remote(client)
+            else:
+                remaining.append((client_loop, client))
+        self._remote_clients = remaining
+        self.close()
+
+    def close(self):
+        executor = getattr(self, "executor", None)
+        if executor:
+            executor.shutdown()
+        # 사이드카 클라이언트는 만든 루프가 멈춰 있으면 그 루프로, 이미 끝났으면 새 루프로 닫음 (실행 중인 루프에서는 aclose 사용)
+        for loop, client in self._remote_clients:
+            if loop.is_closed():
+                asyncio.run(self._aclose_remote(client))
+            elif not loop.is_running():
+                loop.run_until_complete(self._aclose_remote(client))
+        self._remote_clients = []
+        self._remote = None
+        if self.summary_cache:
+            self.summary_cache.close()
+
+    def _summary_signature(self):
+        if self.api_type == "openai":
+            return {"api_type": self.api_type, "model": "gpt-4-turbo"}
+        settings = ("model_name", "max_input_length", "max_output_length", "min_output_length", "length_penalty", "num_beams", "quantization")
+        signature = {"api_type": self.api_type, **{key: AI_CONFIG[key] for key in settings}}
+        if self.decoding:
+            # 적응형 디코딩 요약은 예산에 따라 품질이 달라지므로 고정 설정 요약과 섞지 않음
+            signature["adaptive_levels"] = ADAPTIVE_DECODING_CONFIG["levels"]
+        return signature
+
+    async def _summarize_cached(self, topic_id, text, cache_counts):
+        """(요약, 디코딩 단계)를 반환합니다. 캐시에는 기본 설정(단계 0)으로 만든 요약만 저장합니다."""
+        if not self.summary_cache or not text or len(text.strip()) < 50:
+            return await self._summarize_text(text)
+        key, text_hash = SummaryCache.make_key(topic_id, text, self._summary_signature())
+        cached = await asyncio.to_thread(self.summary_cache.get, key)
+        if cached is not None:
+            cache_counts["hits"] += 1
+            SUMMARY_CACHE_REQUESTS.inc(result="hit")
+            return cached, 0
+        cache_counts["misses"] += 1
+        SUMMARY_CACHE_REQUESTS.inc(result="miss")
+        summary, level = await self._summarize_text(text)
+        # 예산 때문에 빔 수/길이를 줄인 요약은 캐시하지 않아 다음 크롤링에서 다시 만들 수 있게 함
+        if summary and summary != SUMMARY_FAILED_TEXT and level == 0:
+            await asyncio.to_thread(self.summary_cache.put, key, topic_id, text_hash, summary)
+        return summary, level
+
     async def _summarize_text(self, text):
         if not text or len(text.strip()) < 50:
-            return ""
-        if self.api_type == "huggingface":
-            return await self._summarize_with_huggingface(text)
-        elif self.api_type == "openai":
-            return await self._summarize_with_openai(text)
-        return "지원하지 않는 API 타입입니다."
+            return "", 0
+        await self.warm_up()
+        with SUMMARIZE_SECONDS.time(api_type=self.api_type):
+            if self.api_type == "huggingface":
+                return await self._summarize_with_huggingface(text)
+            elif self.api_type == "openai":
+                return await self._summarize_with_openai(text), 0
+        return "지원하지 않는 API 타입입니다.", 0
 
     async def _summarize_with_huggingface(self, text):
-        print(f"  [HF 요약 원문] {text[:150]}...")
-        try:
-            # Note: The prompt template logic is removed as it's a frontend concern now.
-            # A simple instruction is prepended instead.
-            input_text = f"다음 내용을 한국어로 요약해 주세요: {text}"
-            inputs = self.tokenizer(
-                input_text,
-                max_length=AI_CONFIG["max_input_length"],
-                truncation=True,
-                return_tensors="pt"
-            ).to(self.device)
+        summaries, levels = await self._summarize_batch_with_huggingface([text])
+        return summaries[0], levels[0]
+
+    async def summarize_batch(self, texts, budget_seconds=None):
+        """(요약 목록, 항목별 디코딩 단계 목록)을 반환합니다. 적응형 디코딩을 끄면 단계는 모두 0입니다."""
+        await self.warm_up()
+        return await self._summarize_batch_with_huggingface(texts, budget_seconds)
+
+    async def _summarize_batch_with_huggingface(self, texts, budget_seconds=None):
+        if self.decoding and budget_seconds is None:
+            budget_seconds = self.decoding.item_budget()
+        if self.inference_url:
+            return await self._summarize_batch_remote(texts, budget_seconds)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for i in order:
+            print(f"  [HF 요약 원문] {texts[i][:150]}...")
+        plans = [None] * len(texts)
+        if self.decoding:
+            token_counts = await asyncio.to_thread(self._count_input_tokens, texts)
+            plans = [self.decoding.plan(count, budget_seconds) for count in token_counts]
+            for plan in plans:
+                SUMMARY_DECODING_LEVELS.inc(level=plan.level, num_beams=plan.num_beams)
+        results = await asyncio.gather(
+            *(self.executor.submit(texts[i], plans[i]) for i in order),
+            return_exceptions=True
+        )
+        summaries = [""] * len(texts)
+        for i, result in zip(order, results):
+            if isinstance(result, Exception):
+                print(f"  [HF 요약 실패] 오류: {result}")
+                result = SUMMARY_FAILED_TEXT
+            summaries[i] = result
+        return summaries, [plan.level if plan else 0 for plan in plans]
+
+    @staticmethod
+    def _summary_prompt(text):
+        # Note: The prompt template logic is removed as it's a frontend concern now.
+        # A simple instruction is prepended instead.
+        return f"다음 내용을 한국어로 요약해 주세요: {text}"
+
+    def _count_input_tokens(self, texts):
+        encoded = self.tokenizer(
+            [self._summary_prompt(text) for text in texts],
+            max_length=self.decoding.max_input_length,
+            truncation=True
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def _generate_summaries(self, texts, plan=None):
+        import torch
+        input_texts = [self._summary_prompt(text) for text in texts]
+        inputs = self.tokenizer(
+            input_texts,
+            max_length=plan.max_input_length if plan else AI_CONFIG["max_input_length"],
+            truncation=True,
+            padding=True,
+            return_tensors="pt"
+        ).to(self.device)
+        num_beams = plan.num_beams if plan else AI_CONFIG["num_beams"]
+        started = time.perf_counter()
+        with torch.inference_mode() if AI_CONFIG["inference_mode"] else torch.no_grad():
             summary_ids = self.model.generate(
                 inputs["input_ids"],
-                max_length=AI_CONFIG["max_output_length"],
-                min_length=AI_CONFIG["min_output_length"],
+                attention_mask=inputs["attention_mask"],
+                max_length=plan.max_output_length if plan else AI_CONFIG["max_output_length"],
+                min_length=plan.min_output_length if plan else AI_CONFIG["min_output_length"],
                 length_penalty=AI_CONFIG["length_penalty"],
-                num_beams=AI_CONFIG["num_beams"],
-                early_stopping=True
+                num_beams=num_beams,
+                early_stopping=num_beams > 1
             )
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-            print(f"  [HF 요약 성공] {summary.strip()}")
-            return summary.strip()
-        except Exception as e:
-            print(f"  [HF 요약 실패] 오류: {e}")
-            return "요약 생성에 실패했습니다."
+        elapsed = time.perf_counter() - started
+        pad_token_id = self.model.config.pad_token_id
+        input_counts = inputs["attention_mask"].sum(dim=1).tolist()
+        output_counts = (summary_ids != pad_token_id).sum(dim=1).tolist()
+        for input_tokens, output_tokens in zip(input_counts, output_counts):
+            SUMMARY_TOKENS.observe(input_tokens, api_type="huggingface", direction="input")
+            SUMMARY_TOKENS.observe(output_tokens, api_type="huggingface", direction="output")
+        if plan and self.decoding:
+            self.decoding.observe(plan, input_counts, output_counts, elapsed)
+        summaries = [summary.strip() for summary in self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)]
+        for summary in summaries:
+            print(f"  [HF 요약 성공] {summary}")
+        return summaries
 
     async def _summarize_with_openai(self, text):
         print(f"  [OpenAI 요약 원문] {text[:150]}...")
@@ -86,82 +362,260 @@ class NewsFetcher:
                 ]
             )
             summary = response.choices[0].message.content
+            if response.usage:
+                SUMMARY_TOKENS.observe(response.usage.prompt_tokens, api_type="openai", direction="input")
+                SUMMARY_TOKENS.observe(response.usage.completion_tokens, api_type="openai", direction="output")
             print(f"  [OpenAI 요약 성공] {summary.strip()}")
             return summary.strip()
         except Exception as e:
             print(f"[에러] OpenAI 요약 실패: {e}")
             return ""
 
-    async def _get_detail(self, topic_id):
+    def _create_client(self):
+        http2 = CRAWLING_CONFIG["http2"]
+        if http2 and importlib.util.find_spec("h2") is None:
+            print("[CRAWLING] h2 패키지가 없어 HTTP/1.1로 요청합니다.")
+            http2 = False
+        limits = httpx.Limits(
+            max_connections=CRAWLING_CONFIG["max_connections"],
+            max_keepalive_connections=CRAWLING_CONFIG["max_keepalive_connections"]
+        )
+        return httpx.AsyncClient(timeout=CRAWLING_CONFIG["timeout"], limits=limits, http2=http2)
+
+    async def _request(self, client, url, headers=None):
+        host = httpx.URL(url).host
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(CRAWLING_CONFIG["max_connections_per_host"])
+        retries = CRAWLING_CONFIG["retries"]
+        for attempt in range(retries + 1):
+            try:
+                async with self._host_limits[host]:
+                    response = await client.get(url, headers=headers)
+                if response.status_code >= 500 or response.status_code == 429:
+                    response.raise_for_status()
+                return response
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if attempt == retries:
+                    raise
+                delay = CRAWLING_CONFIG["retry_backoff"] * (2 ** attempt)
+                print(f"[CRAWLING] 요청 재시도 {attempt + 1}/{retries} ({delay:.1f}s 후): {url} - {e}")
+                await asyncio.sleep(delay)
+
+    async def _get_detail(self, client, topic_id, validators=None):
+        """(본문, 검증자)를 반환합니다. validators로 조건부 요청해 304면 본문은 None, 실패하면 빈 문자열입니다."""
         try:
-            async with httpx.AsyncClient() as client:
-                url = f'https://news.hada.io/topic?id={topic_id}'
-                response = await client.get(url, timeout=CRAWLING_CONFIG["timeout"])
-                soup = BeautifulSoup(response.text, 'lxml')
-                contents_elem = soup.find('div', class_='topic_contents')
-                if contents_elem:
-                    return contents_elem.get_text(separator=' ', strip=True)
-                desc_elem = soup.find('div', class_='topic_desc')
-                return desc_elem.get_text(strip=True) if desc_elem else ""
+            url = urljoin(CRAWLING_CONFIG["base_url"], f"topic?id={topic_id}")
+            started = time.perf_counter()
+            response = await self._request(client, url, headers=self._conditional_headers(validators))
+            self._record_stage("detail_fetch", started)
+            HTTP_FETCH_SECONDS.observe(time.perf_counter() - started, page="detail")
+            if response.status_code == 304:
+                return None, validators
+            response.raise_for_status()
+            started = time.perf_counter()
+            detail = parse_topic_detail(response.text)
+            self._record_stage("parse_detail", started)
+            return detail, {"etag": response.headers.get("etag"), "last_modified": response.headers.get("last-modified")}
         except Exception as e:
             print(f"긱뉴스 상세 정보 가져오기 실패: {e}")
-            return ""
+            return "", validators
+
+    def _record_stage(self, stage, started):
+        finished = time.perf_counter()
+        first_started = self._stage_started[stage] = min(self._stage_started.get(stage, started), started)
+        timing = self.stage_timings.setdefault(stage, {"count": 0, "seconds": 0.0, "wall_seconds": 0.0})
+        timing["count"] += 1
+        timing["seconds"] += finished - started
+        timing["wall_seconds"] = finished - first_started
+
+    def _finish_crawl(self, started, outcome):
+        self._record_stage("total", started)
+        CRAWL_SECONDS.observe(time.perf_counter() - started, api_type=self.api_type, outcome=outcome)
+        CRAWL_ITEMS.inc(self.last_crawl_stats["reused"], api_type=self.api_type, source="reused")
+        CRAWL_ITEMS.inc(self.last_crawl_stats["processed"], api_type=self.api_type, source="processed")
 
-    async def fetch_news(self):
+    @staticmethod
+    def _emit(on_progress, event, data):
+        if on_progress:
+            on_progress(event, data)
+
+    @staticmethod
+    def emit_items(on_progress, news_items):
+        """새로 처리하지 않고 재사용한 뉴스 목록을 진행 이벤트로 한 번에 알립니다."""
+        if not on_progress:
+            return
+        on_progress("list", {"total": len(news_items), "not_modified": True})
+        for index, item in enumerate(news_items):
+            on_progress("item", {
+                "index": index,
+                "completed": index + 1,
+                "total": len(news_items),
+                "reused": True,
+                "item": item
+            })
+
+    async def _process_or_reuse(self, client, semaphore, entry, previous, cache_counts, progress):
+        content_hash = entry.get('content_hash') or self._entry_hash(entry)
+        item = previous.get(entry['id'])
+        reused = bool(item) and item['content_hash'] == content_hash
+        detail = None
+        if reused and entry['topic_id']:
+            # 목록 행이 같아도 본문이 수정됐을 수 있으므로 저장해 둔 검증자로 상세 페이지를 조건부 요청
+            async with semaphore:
+                detail = await self._get_detail(client, entry['topic_id'], item.get('detail_validators'))
+            text, validators = detail
+            if text is None:
+                self.last_crawl_stats["detail_not_modified"] += 1
+            elif text and self._detail_hash(text) != item.get('detail_hash'):
+                reused = False
+            elif validators != item.get('detail_validators'):
+                item = {**item, 'detail_validators': validators}
+        if reused:
+            self.last_crawl_stats["reused"] += 1
+        else:
+            self.last_crawl_stats["processed"] += 1
+            item, level = await self._process_entry(client, semaphore, entry, cache_counts, progress, detail)
+            # 낮은 단계로 요약한 항목은 content_hash를 남기지 않아 다음 크롤링에서 재사용하지 않고 다시 요약
+            if level == 0:
+                item['content_hash'] = content_hash
+        progress["completed"] += 1
+        if self.decoding:
+            self.decoding.item_done()
+        self._emit(progress["callback"], "item", {
+            "index": entry['index'],
+            "completed": progress["completed"],
+            "total": progress["total"],
+            "reused": reused,
+            "item": item
+        })
+        return item
+
+    async def _process_entry(self, client, semaphore, entry, cache_counts, progress=None, detail=None):
+        desc = entry['desc']
+        detail_fields = {}
+        if entry['topic_id']:
+            if detail is None:
+                async with semaphore:
+                    detail = await self._get_detail(client, entry['topic_id'])
+            detailed_desc, validators = detail
+            if detailed_desc:
+                detail_fields = {'detail_hash': self._detail_hash(detailed_desc), 'detail_validators': validators}
+            if detailed_desc and len(detailed_desc) > len(desc):
+                desc = detailed_desc
+        if progress:
+            self._emit(progress["callback"], "summarizing", {"index": entry['index'], "topic_id": entry['topic_id']})
+        started = time.perf_counter()
+        summarized_desc, level = await self._summarize_cached(entry['topic_id'], desc, cache_counts)
+        self._record_stage("summarize", started)
+        return {
+            'id': entry['id'],
+            'title': entry['title'],
+            'description': summarized_desc if summarized_desc else "요약 정보가 없습니다.",
+            'source_url': entry['source_url'],
+            'discussion_url': entry['discussion_url'],
+            **detail_fields
+        }, level
+
+    @staticmethod
+    def _entry_hash(entry):
+        payload = json.dumps([entry['topic_id'], entry['title'], entry['source_url'], entry['desc']], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _detail_hash(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def _entry_from_item(index, item):
+        """목록이 304일 때 이전 뉴스 항목으로 목록 행을 다시 만듭니다. 목록 설명은 저장하지 않으므로 비워 둡니다."""
+        return {
+            'index': index,
+            'id': item['id'],
+            'topic_id': None if item['id'].startswith("item-") else item['id'],
+            'title': item['title'],
+            'desc': "",
+            'source_url': item['source_url'],
+            'discussion_url': item['discussion_url'],
+            'content_hash': item.get('content_hash')
+        }
+
+    @staticmethod
+    def _conditional_headers(validators):
+        headers = {}
+        if validators and validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators and validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers or None
+
+    def _list_request_headers(self, previous_items):
+        if not previous_items:
+            return None
+        return self._conditional_headers(self.list_validators)
+
+    async def fetch_news(self, previous_items=None, on_progress=None):
         print(f"\nGeekNews 크롤링 및 요약 시작 (API: {self.api_type})...")
-        async with httpx.AsyncClient(timeout=CRAWLING_CONFIG["timeout"]) as client:
+        self._host_limits = {}
+        self.last_crawl_stats = {"not_modified": False, "reused": 0, "processed": 0, "detail_not_modified": 0, "error": None}
+        self.stage_timings = {}
+        self._stage_started = {}
+        crawl_started = time.perf_counter()
+        self._emit(on_progress, "stage", {"stage": "list"})
+        async with self._create_client() as client:
             try:
-                response = await client.get(CRAWLING_CONFIG["base_url"])
-                response.raise_for_status()
-            except httpx.RequestError as e:
+                started = time.perf_counter()
+                response = await self._request(
+                    client, CRAWLING_CONFIG["base_url"], headers=self._list_request_headers(previous_items)
+                )
+                self._record_stage("list_fetch", started)
+                HTTP_FETCH_SECONDS.observe(time.perf_counter() - started, page="list")
+                not_modified = response.status_code == 304
+                if not not_modified:
+                    response.raise_for_status()
+            except httpx.HTTPError as e:
                 print(f"[에러] GeekNews 페이지를 가져올 수 없습니다: {e}")
+                self.last_crawl_stats["error"] = str(e)
+                self._finish_crawl(crawl_started, "error")
                 return []
+            if not_modified:
+                # 목록이 그대로여도 상세 본문은 수정될 수 있으므로 이전 항목의 상세 페이지만 조건부로 다시 확인
+                self.last_crawl_stats["not_modified"] = True
+                print(f"[CRAWLING] GeekNews: 목록 변경 없음 (304), 이전 뉴스 {len(previous_items)}개의 상세 페이지만 확인")
+                entries = [self._entry_from_item(index, item) for index, item in enumerate(previous_items)]
+            else:
+                self.list_validators = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified")
+                }
+                started = time.perf_counter()
+                entries = parse_topic_list(response.text, CRAWLING_CONFIG["news_count"], CRAWLING_CONFIG["base_url"])
+                self._record_stage("parse_list", started)
+
+            previous = {
+                item['id']: item for item in previous_items or []
+                if item.get('content_hash') and item.get('description') != SUMMARY_FAILED_TEXT
+            }
+            semaphore = asyncio.Semaphore(CRAWLING_CONFIG["detail_concurrency"])
+            cache_counts = {"hits": 0, "misses": 0}
+            progress = {"callback": on_progress, "total": len(entries), "completed": 0}
+            self._emit(on_progress, "list", {"total": len(entries), "not_modified": not_modified})
+            self._emit(on_progress, "stage", {"stage": "details"})
+            if self.decoding:
+                self.decoding.start_crawl(len(entries), started=crawl_started)
+            try:
+                news_items = await asyncio.gather(
+                    *(self._process_or_reuse(client, semaphore, entry, previous, cache_counts, progress) for entry in entries)
+                )
+            finally:
+                if self.decoding:
+                    self.decoding.finish_crawl()
+            print(
+                f"[CRAWLING] GeekNews: 변경 없는 토픽 {self.last_crawl_stats['reused']}개 재사용 "
+                f"(상세 304 {self.last_crawl_stats['detail_not_modified']}개), 새로 처리 {self.last_crawl_stats['processed']}개"
+            )
+            if self.summary_cache:
+                print(f"[CACHE] 요약 캐시: hit {cache_counts['hits']}개, miss {cache_counts['misses']}개")
 
-            soup = BeautifulSoup(response.text, 'lxml')
-            news_items = []
-            topics = soup.find_all('div', class_='topic_row')[:CRAWLING_CONFIG["news_count"]]
-
-            for topic in topics:
-                title_elem = topic.find('div', class_='topictitle')
-                if not title_elem: continue
-                title_link = title_elem.find('a')
-                if not title_link: continue
-
-                title = title_link.text.strip()
-                original_link = title_link.get('href', '')
-                if original_link and original_link.startswith('/'):
-                    original_link = f"https://news.hada.io{original_link}"
-                
-                topic_id = None
-                geeknews_link = ""
-                all_links = topic.find_all('a')
-                for link in all_links:
-                    href = link.get('href', '')
-                    if 'topic?id=' in href:
-                        try:
-                            topic_id = href.split('id=')[-1].split('&')[0]
-                            geeknews_link = f"https://news.hada.io{href}"
-                            break
-                        except:
-                            pass
-                
-                desc_elem = topic.find('span', class_='topicdesc')
-                desc = desc_elem.text.strip() if desc_elem else ''
-                
-                if topic_id:
-                    detailed_desc = await self._get_detail(topic_id)
-                    if detailed_desc and len(detailed_desc) > len(desc):
-                        desc = detailed_desc
-
-                summarized_desc = await self._summarize_text(desc)
-                
-                news_items.append({
-                    'id': topic_id or f"item-{len(news_items)}",
-                    'title': title,
-                    'description': summarized_desc if summarized_desc else "요약 정보가 없습니다.",
-                    'source_url': original_link,
-                    'discussion_url': geeknews_link,
-                })
-            
+            self._finish_crawl(crawl_started, "not_modified" if not_modified else "success")
             print(f"✓ 뉴스 {len(news_items)}개 크롤링 및 요약 완료.")
-            return news_items 
\ No newline at end of file
+            return list(news_items)
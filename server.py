@@ -1,21 +1,39 @@
-from fastapi import FastAPI, HTTPException
+import time
+STARTUP_STARTED = time.perf_counter()
+import asyncio
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ValidationError
 from typing import List, Optional
 from generator import NewsFetcher
+from config import EXPORT_CONFIG, PRERENDER_CONFIG, RENDER_CACHE_CONFIG, SHARED_CACHE_CONFIG, SNAPSHOT_RETENTION, STATE_LOG_CONFIG
+from utils.browser_pool import BrowserPool
+from utils.exporter import combine_image_files, images_to_pdf
+from utils.cards import build_card_pages
+from utils.render_cache import RenderCache
+from utils.snapshot_store import SnapshotStore
+from utils.state_index import StateIndex
+from utils.state_log import RevisionConflict, RevisionUnavailable, StateLog, merge_patch
+from utils.single_flight import SingleFlight
+from utils.progress import ProgressLog
+from utils.process_lock import ProcessLock
+from utils.shared_cache import SharedNewsCache
+from utils.http_cache import GZIP_MINIMUM_SIZE, conditional_response, encode_json, make_etag
+from utils.metrics import (
+    EXPORT_CACHE_REQUESTS, EXPORT_RENDER_SECONDS, INFERENCE_QUEUE_DEPTH, NEWS_CACHE_AGE, NEWS_CACHE_REQUESTS, REGISTRY,
+    SCHEDULER_JOB_SECONDS, SCHEDULER_JOBS, monitor_event_loop_lag
+)
 import os
-import time
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta
 import json
+import re
+import shutil
 from pathlib import Path
 import aiofiles
-from playwright.async_api import async_playwright
-from PIL import Image, ImageDraw, ImageFont
-import io
-import base64
-import textwrap
 
 app = FastAPI()
 
@@ -23,9 +41,18 @@ app = FastAPI()
 CACHE = {
     "news": None,
     "last_updated": 0,
-    "last_crawled_date": None
+    "last_crawled_date": None,
+    "crawled_at": None,
+    "last_refresh_error": None,
+    "shared_version": 0,
+    "payload": None
 }
-CACHE_TTL_SECONDS = 600  # 10 Minuten
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", 600))  # 10 Minuten (soft TTL: 이후에는 stale 데이터를 주고 백그라운드에서 갱신)
+CACHE_HARD_TTL_SECONDS = int(os.getenv("CACHE_HARD_TTL_SECONDS", 172800))  # 이 시간보다 오래된 데이터는 제공하지 않음
+CACHE_STALE_WHILE_REVALIDATE = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+BACKGROUND_TASKS = set()
+COMPACTION_TASKS = set()
+CRAWL_PROGRESS = {}
 
 scheduler = AsyncIOScheduler()
 schedule_hour = int(os.getenv("SCHEDULE_HOUR", 8))
@@ -38,13 +65,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "Age", "X-Cache-Status", "X-Cache-Refreshing"],
 )
+# 큰 JSON 응답(저장된 상태, 뉴스 목록)은 gzip으로 압축
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
 
-# AI 모델 타입에 따라 NewsFetcher 인스턴스를 관리
+# AI 모델 타입에 따라 NewsFetcher 인스턴스를 관리 (모델은 첫 사용 또는 워밍업 시 로드)
 fetchers = {
     "huggingface": NewsFetcher(api_type="huggingface"),
     # "openai": NewsFetcher(api_type="openai") # 필요 시 주석 해제
 }
+browser_pool = BrowserPool(
+    size=EXPORT_CONFIG["browser_pool_size"],
+    viewport=EXPORT_CONFIG["viewport"],
+    acquire_timeout=EXPORT_CONFIG["acquire_timeout"],
+    health_check_interval=EXPORT_CONFIG["health_check_interval"]
+)
+crawl_flight = SingleFlight(name="CRAWL")
+
+# 워커 간 공유: 뉴스 캐시(SQLite), 크롤링 잠금, 스케줄러 리더 잠금
+shared_cache = SharedNewsCache(SHARED_CACHE_CONFIG["path"]) if SHARED_CACHE_CONFIG["enabled"] else None
+LOCK_DIR = Path(SHARED_CACHE_CONFIG["lock_dir"])
+scheduler_lock = ProcessLock(LOCK_DIR / "scheduler.lock") if shared_cache else None
+crawl_locks = {api_type: ProcessLock(LOCK_DIR / f"crawl_{api_type}.lock") for api_type in fetchers} if shared_cache else {}
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "true").lower() == "true"
+STARTUP_TIMINGS = {"import_seconds": round(time.perf_counter() - STARTUP_STARTED, 3)}
 
 class NewsItem(BaseModel):
     id: str
@@ -60,61 +105,201 @@ class SaveStateRequest(BaseModel):
     theme: dict
     config: dict
 
+class StatePatchRequest(BaseModel):
+    base_revision: int  # 마지막으로 저장/불러온 revision
+    patch: dict  # JSON Merge Patch: 바뀐 필드만 보내고, 지울 필드는 null
+
 class ExportRequest(BaseModel):
     html_content: str
     page_type: str  # 'cover', 'news', 'summary'
     page_index: Optional[int] = 0
     export_format: str = "png"  # 'png', 'pdf', 'html'
+    session_id: Optional[str] = None  # 같은 세션의 PNG만 모아서 결합할 때 사용
+
+class BatchExportRequest(BaseModel):
+    items: List[ExportRequest]
+    combine: bool = False  # PNG 페이지들을 세로로 이어 붙인 이미지 생성
+    combine_format: str = "png"  # 'png', 'jpeg', 'webp'
+    combine_max_width: Optional[int] = None  # 지정 시 결합 이미지를 이 너비로 축소
+    pdf: bool = False  # PNG 페이지들로 다중 페이지 PDF 생성
+
+class CombineImagesRequest(BaseModel):
+    filenames: Optional[List[str]] = None  # output 디렉터리 기준 파일명 (순서대로 결합)
+    session_id: Optional[str] = None
+    output_format: str = "png"  # 'png', 'jpeg', 'webp'
+    max_width: Optional[int] = None
+    quality: int = 90
 
 DATA_DIR = Path("./data/saved_states")
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+state_index = StateIndex(DATA_DIR)
+snapshot_store = SnapshotStore(DATA_DIR)
+state_log = StateLog(STATE_LOG_CONFIG["path"])
+OUTPUT_DIR = Path("./output")
+SESSION_DIR = OUTPUT_DIR / "sessions"
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+DAILY_DIR = Path(PRERENDER_CONFIG["output_dir"])
+DAILY_DATE_PATTERN = re.compile(r"^\d{8}$")
+prerender_lock = ProcessLock(LOCK_DIR / "prerender.lock")
+RENDER_CACHE_DIR = OUTPUT_DIR / "render_cache"
+render_cache = RenderCache(
+    RENDER_CACHE_CONFIG["path"], RENDER_CACHE_DIR,
+    max_bytes=RENDER_CACHE_CONFIG["max_bytes"],
+    max_age_seconds=RENDER_CACHE_CONFIG["max_age_days"] * 86400
+) if RENDER_CACHE_CONFIG["enabled"] else None
+render_flight = SingleFlight(name="RENDER")
+# 결과 이미지에 영향을 주는 렌더링 설정 (바꾸면 캐시 키가 달라짐)
+RENDER_SETTINGS = {"viewport": EXPORT_CONFIG["viewport"], "full_page": False, "pdf": {"format": "A4", "margin": 0}}
+
+async def write_snapshot(filename: Path, save_data: dict):
+    size = await asyncio.to_thread(snapshot_store.write, filename.name, save_data)
+    await asyncio.to_thread(state_index.record, filename.name, save_data, size)
+    await asyncio.to_thread(prune_snapshots)
+
+async def read_snapshot(filepath: Path) -> dict:
+    return await asyncio.to_thread(snapshot_store.read, filepath)
+
+def load_state_checkpoint(filename: str) -> dict:
+    return snapshot_store.read(DATA_DIR / filename)
+
+def prune_snapshots():
+    """SNAPSHOT_RETENTION에 따라 오래된 스냅샷을 지우고, 더 이상 참조되지 않는 뉴스 항목을 정리합니다."""
+    removed = 0
+    for kind, policy in SNAPSHOT_RETENTION.items():
+        rows, _ = state_index.list([kind], limit=-1)
+        cutoff = None
+        if policy.get("max_age_days"):
+            cutoff = (datetime.now() - timedelta(days=policy["max_age_days"])).strftime("%Y%m%d%H%M%S")
+        keep = max(1, policy.get("keep") or len(rows))
+        for position, row in enumerate(rows):
+            if position == 0 or (position < keep and not (cutoff and row["stamp"] < cutoff)):
+                continue
+            snapshot_store.delete(row["filename"])
+            state_index.remove(row["filename"])
+            if kind == "state":
+                state_log.forget_checkpoint(row["filename"])
+            removed += 1
+    if removed:
+        state_log.trim()
+        items = snapshot_store.collect_garbage()
+        print(f"[SNAPSHOT] 보관 정책에 따라 스냅샷 {removed}개, 뉴스 항목 {items}개 삭제")
+    return removed
+
+def snapshot_timestamp(data: dict, row: dict) -> float:
+    try:
+        return datetime.fromisoformat(data["crawled_at"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return datetime.strptime(row["stamp"], "%Y%m%d%H%M%S").timestamp()
+
+def cache_age() -> Optional[float]:
+    if CACHE["news"] is None:
+        return None
+    return time.time() - (CACHE["crawled_at"] or CACHE["last_updated"])
+
+def is_refreshing(api_type: str = "huggingface") -> bool:
+    return crawl_flight.running(api_type) or bool(BACKGROUND_TASKS)
+
+def set_cache_headers(response: Response, status: str):
+    age = cache_age()
+    response.headers["X-Cache-Status"] = status
+    response.headers["X-Cache-Refreshing"] = "true" if is_refreshing() else "false"
+    if age is not None:
+        response.headers["Age"] = str(max(0, int(age)))
+
+def news_payload():
+    """캐시된 뉴스가 바뀔 때만 직렬화하고 ETag를 계산합니다."""
+    news = CACHE["news"]
+    payload = CACHE["payload"]
+    if payload is None or payload[0] is not news:
+        body = encode_json([NewsItem(**item) for item in news])
+        payload = (news, body, make_etag(body))
+        CACHE["payload"] = payload
+    return payload[1], payload[2]
+
+def news_response(request: Request, status: str) -> Response:
+    body, etag = news_payload()
+    response = conditional_response(request, body, etag, CACHE["crawled_at"] or CACHE["last_updated"])
+    set_cache_headers(response, status)
+    return response
+
+async def refresh_in_background(api_type: str, snapshot_kind: Optional[str] = None):
+    try:
+        await run_crawl(api_type, snapshot_kind)
+        CACHE["last_refresh_error"] = None
+        print("[CACHE] 백그라운드 갱신 완료")
+    except Exception as e:
+        CACHE["last_refresh_error"] = str(e)
+        print(f"[ERROR] 백그라운드 갱신 실패: {e}")
+
+def schedule_background_refresh(api_type: str, snapshot_kind: Optional[str] = None):
+    # 진행 중인 크롤링이 있어도 스냅샷을 요청했다면 합류해서 그 결과로 스냅샷을 남김
+    if crawl_flight.running(api_type) and not snapshot_kind:
+        return
+    task = asyncio.create_task(refresh_in_background(api_type, snapshot_kind))
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(BACKGROUND_TASKS.discard)
+
+async def sync_shared_cache() -> bool:
+    """다른 워커가 더 새로운 크롤링 결과를 공유 캐시에 저장했으면 메모리 캐시로 가져옵니다."""
+    if not shared_cache:
+        return False
+    version = await asyncio.to_thread(shared_cache.version)
+    if version <= CACHE["shared_version"]:
+        return False
+    entry = await asyncio.to_thread(shared_cache.load)
+    if not entry:
+        return False
+    CACHE["news"] = entry["news"]
+    CACHE["last_updated"] = entry["last_updated"]
+    CACHE["last_crawled_date"] = entry["last_crawled_date"]
+    CACHE["crawled_at"] = entry["crawled_at"]
+    CACHE["shared_version"] = entry["version"]
+    print(f"[CACHE] 공유 캐시에서 뉴스 데이터를 가져왔습니다 (version {entry['version']}, {len(entry['news'])}개)")
+    return True
+
+async def publish_shared_cache():
+    if not shared_cache:
+        return
+    CACHE["shared_version"] = await asyncio.to_thread(
+        shared_cache.store, CACHE["news"], CACHE["last_updated"], CACHE["last_crawled_date"], CACHE["crawled_at"]
+    )
 
 async def load_cached_news_from_volume():
     """볼륨에서 오늘 날짜의 크롤링 데이터를 로드합니다."""
     try:
         today = datetime.now().strftime("%Y%m%d")
         
-        # 오늘 날짜의 자동 크롤링 파일 찾기
-        auto_files = sorted(DATA_DIR.glob(f"auto_crawled_{today}_*.json"), reverse=True)
-        manual_files = sorted(DATA_DIR.glob(f"manual_refresh_{today}_*.json"), reverse=True)
-        
-        # 모든 오늘 날짜 파일을 시간순으로 정렬
-        all_files = sorted(auto_files + manual_files, 
-                          key=lambda f: f.stat().st_mtime, 
-                          reverse=True)
+        # 색인에서 오늘 날짜의 최신 크롤링 스냅샷 찾기 (자동/수동 모두)
+        latest = await asyncio.to_thread(state_index.latest, ["auto_crawled", "manual_refresh"], today)
         
-        if all_files:
-            latest_file = all_files[0]
-            async with aiofiles.open(latest_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                data = json.loads(content)
+        if latest:
+            data = await read_snapshot(DATA_DIR / latest["filename"])
             
             if "news_items" in data:
                 CACHE["news"] = data["news_items"]
                 CACHE["last_updated"] = time.time()
                 CACHE["last_crawled_date"] = today
+                CACHE["crawled_at"] = snapshot_timestamp(data, latest)
                 
                 crawled_at = data.get("crawled_at", "Unknown")
-                print(f"[CACHE] 볼륨에서 캐시 로드 완료: {latest_file.name}")
+                print(f"[CACHE] 볼륨에서 캐시 로드 완료: {latest['filename']}")
                 print(f"[CACHE] 크롤링 시간: {crawled_at}, 뉴스 개수: {len(data['news_items'])}")
                 return True
         
         # 오늘 데이터가 없으면 어제 데이터라도 로드
         yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
-        yesterday_files = sorted(DATA_DIR.glob(f"*_{yesterday}_*.json"), reverse=True)
+        latest = await asyncio.to_thread(state_index.latest, ["auto_crawled", "manual_refresh"], yesterday)
         
-        if yesterday_files:
-            latest_file = yesterday_files[0]
-            async with aiofiles.open(latest_file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                data = json.loads(content)
+        if latest:
+            data = await read_snapshot(DATA_DIR / latest["filename"])
             
             if "news_items" in data:
                 CACHE["news"] = data["news_items"]
                 CACHE["last_updated"] = time.time() - CACHE_TTL_SECONDS  # 캐시 즉시 만료 설정
                 CACHE["last_crawled_date"] = yesterday
+                CACHE["crawled_at"] = snapshot_timestamp(data, latest)
                 
-                print(f"[CACHE] 어제 데이터 로드: {latest_file.name}")
+                print(f"[CACHE] 어제 데이터 로드: {latest['filename']}")
                 return True
                 
     except Exception as e:
@@ -123,71 +308,113 @@ async def load_cached_news_from_volume():
     return False
 
 @app.get("/api/news", response_model=List[NewsItem])
-async def get_news(api_type: Optional[str] = "huggingface", force_refresh: bool = False):
+async def get_news(request: Request, api_type: Optional[str] = "huggingface", force_refresh: bool = False):
     """
     GeekNews를 크롤링하고 요약하여 뉴스 목록을 반환합니다.
-    우선순위: 메모리 캐시 → 볼륨 데이터 → 새로 크롤링
+    우선순위: 메모리 캐시 → 볼륨 데이터 → stale 캐시(백그라운드 갱신) → 새로 크롤링
     `force_refresh=true` 쿼리 파라미터를 사용하여 캐시를 무시하고 새로고침할 수 있습니다.
     """
+    await sync_shared_cache()
     current_time = time.time()
     today = datetime.now().strftime("%Y%m%d")
     
     # 1. 메모리 캐시 확인 (force_refresh가 아닌 경우)
     if not force_refresh and CACHE["news"] and (current_time - CACHE["last_updated"] < CACHE_TTL_SECONDS):
         print("[CACHE] 메모리 캐시에서 뉴스 데이터를 반환합니다.")
-        return CACHE["news"]
+        NEWS_CACHE_REQUESTS.inc(tier="memory")
+        return news_response(request, "fresh")
     
     # 2. 볼륨에서 오늘 데이터 확인 (force_refresh가 아닌 경우)
     if not force_refresh and CACHE["last_crawled_date"] != today:
         volume_loaded = await load_cached_news_from_volume()
-        if volume_loaded and CACHE["news"]:
+        if volume_loaded and CACHE["news"] and CACHE["last_crawled_date"] == today:
             print("[CACHE] 볼륨에서 로드한 뉴스 데이터를 반환합니다.")
-            return CACHE["news"]
+            NEWS_CACHE_REQUESTS.inc(tier="volume")
+            return news_response(request, "fresh")
     
     # 3. 오늘 이미 크롤링했는지 확인 (force_refresh가 아닌 경우)
     if not force_refresh and CACHE["last_crawled_date"] == today and CACHE["news"]:
         print("[CACHE] 오늘 이미 크롤링한 데이터를 반환합니다.")
         CACHE["last_updated"] = current_time  # TTL 갱신
-        return CACHE["news"]
+        NEWS_CACHE_REQUESTS.inc(tier="memory")
+        return news_response(request, "fresh")
 
     if api_type not in fetchers:
         raise HTTPException(status_code=400, detail=f"지원하지 않는 API 타입: {api_type}. 사용 가능: {list(fetchers.keys())}")
     
+    # 4. hard TTL 이내의 stale 데이터는 즉시 반환하고 백그라운드에서 갱신
+    age = cache_age()
+    if not force_refresh and CACHE_STALE_WHILE_REVALIDATE and CACHE["news"] and age < CACHE_HARD_TTL_SECONDS:
+        print(f"[CACHE] stale 데이터를 반환하고 백그라운드에서 갱신합니다 (age={int(age)}s).")
+        schedule_background_refresh(api_type)
+        NEWS_CACHE_REQUESTS.inc(tier="stale")
+        return news_response(request, "stale")
+    
     try:
         print("[API] 새로운 뉴스 데이터를 가져옵니다 (캐시 만료 또는 강제 새로고침).")
-        fetcher = fetchers[api_type]
-        news_items = await fetcher.fetch_news()
-        
-        # 캐시 업데이트
-        CACHE["news"] = news_items
-        CACHE["last_updated"] = current_time
-        CACHE["last_crawled_date"] = today
-        
-        # force_refresh인 경우 자동 저장
-        if force_refresh:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = DATA_DIR / f"manual_refresh_{timestamp}.json"
-            
-            save_data = {
-                "version": "1.0",
-                "saved_at": datetime.now().isoformat(),
-                "crawled_at": datetime.now().isoformat(),
-                "auto_saved": False,
-                "force_refresh": True,
-                "news_count": len(news_items),
-                "news_items": news_items
-            }
-            
-            async with aiofiles.open(filename, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(save_data, ensure_ascii=False, indent=2))
-            
-            print(f"[API] 강제 새로고침 데이터 저장 완료: {filename}")
-        
-        return news_items
+        NEWS_CACHE_REQUESTS.inc(tier="fresh")
+        await run_crawl(api_type, "manual_refresh" if force_refresh else None)
+        return news_response(request, "refresh" if force_refresh else "miss")
     except Exception as e:
         print(f"[에러] /api/news 처리 중 오류 발생: {e}")
         raise HTTPException(status_code=500, detail="뉴스 정보를 가져오는 중 서버에서 오류가 발생했습니다.")
 
+def stream_frame(event: str, data: dict, stream_format: str) -> bytes:
+    if event == "item":
+        data = {**data, "item": NewsItem(**data["item"])}
+    if stream_format == "ndjson":
+        return encode_json({"event": event, **data}) + b"\n"
+    return b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+async def cached_news_events(status: str):
+    news = CACHE["news"]
+    yield "cache", {"status": status, "age": int(cache_age())}
+    yield "list", {"total": len(news), "not_modified": True}
+    for index, item in enumerate(news):
+        yield "item", {"index": index, "completed": index + 1, "total": len(news), "reused": True, "item": item}
+    yield "done", {"count": len(news)}
+
+@app.get("/api/news/stream")
+async def stream_news(
+    api_type: Optional[str] = "huggingface",
+    force_refresh: bool = False,
+    stream_format: str = Query("sse", alias="format", pattern="^(sse|ndjson)$")
+):
+    """
+    뉴스를 요약이 끝나는 대로 하나씩 스트리밍합니다 (SSE 또는 NDJSON).
+    이벤트: stage, list, summarizing, item, done, error (캐시에서 보낼 때는 cache 이벤트가 먼저 옵니다)
+    """
+    if api_type not in fetchers:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 API 타입: {api_type}. 사용 가능: {list(fetchers.keys())}")
+
+    await sync_shared_cache()
+    if not force_refresh and not CACHE["news"]:
+        await load_cached_news_from_volume()
+
+    crawling = crawl_flight.running(api_type)
+    if force_refresh or crawling or not CACHE["news"] or cache_age() >= CACHE_HARD_TTL_SECONDS:
+        progress = crawl_progress(api_type)
+        if not crawling:
+            print("[API] 스트리밍 요청으로 뉴스 크롤링을 시작합니다.")
+        schedule_background_refresh(api_type, "manual_refresh" if force_refresh else None)
+        events = progress.follow()
+    else:
+        status = "fresh" if cache_age() < CACHE_TTL_SECONDS else "stale"
+        if status == "stale" and CACHE_STALE_WHILE_REVALIDATE:
+            schedule_background_refresh(api_type)
+        events = cached_news_events(status)
+
+    async def body():
+        async for event, data in events:
+            yield stream_frame(event, data, stream_format)
+
+    media_type = "application/x-ndjson" if stream_format == "ndjson" else "text/event-stream"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"}
+    )
+
 @app.get("/")
 def read_root():
     """헬스체크 및 기본 정보 제공"""
@@ -200,12 +427,37 @@ def read_root():
             "last_updated": time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(CACHE["last_updated"])),
             "last_crawled_date": CACHE["last_crawled_date"],
             "news_count": len(CACHE["news"]) if CACHE["news"] else 0,
-            "ttl_seconds": CACHE_TTL_SECONDS
+            "ttl_seconds": CACHE_TTL_SECONDS,
+            "hard_ttl_seconds": CACHE_HARD_TTL_SECONDS,
+            "stale_while_revalidate": CACHE_STALE_WHILE_REVALIDATE,
+            "age_seconds": int(cache_age()) if CACHE["news"] is not None else None,
+            "refreshing": is_refreshing(),
+            "last_refresh_error": CACHE["last_refresh_error"]
+        },
+        "startup_timings": STARTUP_TIMINGS,
+        "model_status": {
+            api_type: fetcher.warmup_status() for api_type, fetcher in fetchers.items()
+        },
+        "inference_status": {
+            api_type: fetcher.inference_stats() for api_type, fetcher in fetchers.items()
+        },
+        "summary_cache_status": {
+            api_type: fetcher.summary_cache_stats() for api_type, fetcher in fetchers.items()
+        },
+        "browser_pool_status": browser_pool.status(),
+        "render_cache_status": render_cache.info() if render_cache else None,
+        "snapshot_store_status": snapshot_store.info(),
+        "state_log_status": state_log.info(),
+        "crawl_status": {
+            **crawl_flight.status(),
+            "last_crawl": {api_type: fetcher.last_crawl_stats for api_type, fetcher in fetchers.items()}
         },
         "scheduler_status": {
             "enabled": scheduler.running,
-            "schedule_time": f"{schedule_hour:02d}:{schedule_minute:02d}"
+            "schedule_time": f"{schedule_hour:02d}:{schedule_minute:02d}",
+            "leader": scheduler_lock.status() if scheduler_lock else None
         },
+        "shared_cache_status": shared_cache.info() if shared_cache else None,
         "endpoints": {
             "GET /api/news": {
                 "description": "GeekNews 최신 뉴스를 크롤링하고 AI로 요약하여 반환합니다.",
@@ -214,6 +466,29 @@ def read_root():
                     "force_refresh": "true 또는 false. 캐시를 무시하고 새로 데이터를 가져옵니다."
                 }
             },
+            "GET /api/news/stream": {
+                "description": "요약이 끝난 뉴스를 하나씩 스트리밍합니다. 진행 중인 크롤링이 있으면 합류합니다.",
+                "parameters": {
+                    "api_type": "선택 가능한 값: 'huggingface' (기본값)",
+                    "force_refresh": "true 또는 false. 캐시를 무시하고 새로 크롤링합니다.",
+                    "format": "'sse' (기본값, text/event-stream) 또는 'ndjson' (application/x-ndjson)"
+                }
+            },
+            "GET /api/daily": {
+                "description": "정기 크롤링 직후 미리 렌더링해 둔 날짜 목록 (PRERENDER_CONFIG['enabled']일 때 생성)"
+            },
+            "GET /api/daily/{date}": {
+                "description": "해당 날짜(YYYYMMDD 또는 latest)의 카드 페이지와 결합 이미지 목록"
+            },
+            "GET /api/daily/{date}/{filename}": {
+                "description": "미리 렌더링된 이미지 파일을 그대로 내려줍니다."
+            },
+            "POST /api/daily/render": {
+                "description": "현재 캐시된 뉴스로 오늘 카드 이미지를 지금 렌더링합니다."
+            },
+            "GET /metrics": {
+                "description": "크롤링, 상세 요청, 요약(지연 시간/토큰), 캐시 계층, 렌더링, 예약 작업, 이벤트 루프 지연 메트릭 (Prometheus 형식)"
+            },
             "GET /api/schedule-status": {
                 "description": "스케줄러 상태와 다음 실행 시간을 확인합니다."
             },
@@ -221,60 +496,186 @@ def read_root():
                 "description": "편집된 상태를 서버에 저장합니다.",
                 "body": "SaveStateRequest 모델"
             },
+            "PATCH /api/state": {
+                "description": "마지막 revision 이후 바뀐 필드만 저장합니다 (JSON Merge Patch). 기준 revision이 최신이 아니면 409를 반환합니다.",
+                "body": "StatePatchRequest 모델 (base_revision, patch)"
+            },
             "GET /api/state": {
                 "description": "저장된 상태를 불러옵니다.",
                 "parameters": {
-                    "filename": "특정 파일명 (선택사항, 없으면 최신 파일)"
+                    "filename": "특정 파일명 (선택사항)",
+                    "revision": "특정 revision (선택사항, filename과 둘 다 없으면 최신 revision)"
                 }
             },
             "GET /api/state/list": {
-                "description": "저장된 상태 목록을 조회합니다."
+                "description": "저장된 상태 목록을 색인에서 조회합니다.",
+                "parameters": {
+                    "limit": "반환할 개수 (기본값 20)",
+                    "offset": "건너뛸 개수 (페이지네이션)",
+                    "kind": "'state' (기본값), 'auto_crawled', 'manual_refresh'",
+                    "date": "YYYYMMDD 형식 날짜 (선택사항)"
+                }
             },
             "POST /api/export": {
                 "description": "HTML 콘텐츠를 이미지 또는 PDF로 변환하여 저장합니다.",
                 "body": "ExportRequest 모델"
             },
+            "POST /api/export/batch": {
+                "description": "여러 페이지를 한 번에 동시 렌더링하고, 선택적으로 결합 이미지와 다중 페이지 PDF를 생성합니다.",
+                "body": "BatchExportRequest 모델"
+            },
             "POST /api/export/combine-images": {
-                "description": "여러 이미지를 하나의 이미지로 결합합니다."
+                "description": "여러 이미지를 하나의 이미지로 결합합니다. 파일 목록이나 내보내기 세션을 지정하면 해당 이미지만 결합합니다.",
+                "body": "CombineImagesRequest 모델 (선택사항)"
             }
         }
     }
 
+async def latest_crawled_items(fetcher: NewsFetcher):
+    if CACHE["news"] and fetcher.list_validators:
+        return CACHE["news"]
+    latest = await asyncio.to_thread(state_index.latest, ["auto_crawled", "manual_refresh"])
+    if not latest:
+        return CACHE["news"] or None
+    data = await read_snapshot(DATA_DIR / latest["filename"])
+    if not fetcher.list_validators:
+        fetcher.list_validators = data.get("list_validators") or {}
+    return CACHE["news"] or data.get("news_items")
+
+async def crawl_news(api_type: str, snapshot_kind: Optional[str] = None, on_progress=None):
+    """다른 워커가 같은 크롤링을 진행 중이면 끝날 때까지 기다렸다가 그 결과를 공유 캐시에서 가져옵니다."""
+    lock = crawl_locks.get(api_type)
+    if lock is None:
+        return await crawl_and_store(api_type, snapshot_kind, on_progress)
+    async with lock.hold() as waited:
+        if waited and await sync_shared_cache():
+            print("[CRAWL] 다른 워커가 방금 크롤링을 마쳐 그 결과를 사용합니다.")
+            NewsFetcher.emit_items(on_progress, CACHE["news"])
+            # 다른 워커의 크롤링은 이 요청의 스냅샷을 남기지 않으므로 공유받은 결과로 저장
+            if snapshot_kind:
+                await store_crawl_snapshot(fetchers[api_type], CACHE["news"], snapshot_kind)
+            return CACHE["news"]
+        return await crawl_and_store(api_type, snapshot_kind, on_progress)
+
+async def crawl_and_store(api_type: str, snapshot_kind: Optional[str] = None, on_progress=None):
+    fetcher = fetchers[api_type]
+    news_items = await fetcher.fetch_news(
+        previous_items=await latest_crawled_items(fetcher),
+        on_progress=on_progress
+    )
+    # 목록을 가져오지 못한 크롤링은 이전 캐시/공유 캐시/스냅샷을 그대로 두고 실패로 처리
+    if not news_items:
+        raise RuntimeError(f"뉴스 목록을 가져오지 못했습니다: {fetcher.last_crawl_stats.get('error') or '항목 없음'}")
+    
+    # 캐시 업데이트
+    CACHE["news"] = news_items
+    CACHE["last_updated"] = time.time()
+    CACHE["last_crawled_date"] = datetime.now().strftime("%Y%m%d")
+    CACHE["crawled_at"] = CACHE["last_updated"]
+    await publish_shared_cache()
+    
+    # 정기 크롤링/강제 새로고침 결과는 볼륨에 자동 저장
+    if snapshot_kind:
+        await store_crawl_snapshot(fetcher, news_items, snapshot_kind)
+    
+    return news_items
+
+async def store_crawl_snapshot(fetcher: NewsFetcher, news_items: List[dict], snapshot_kind: str):
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = DATA_DIR / SnapshotStore.filename(snapshot_kind, timestamp)
+    
+    save_data = {
+        "version": "1.0",
+        "saved_at": datetime.now().isoformat(),
+        "crawled_at": datetime.now().isoformat(),
+        "auto_saved": snapshot_kind == "auto_crawled",
+        "news_count": len(news_items),
+        "news_items": news_items,
+        "list_validators": fetcher.list_validators
+    }
+    if snapshot_kind == "manual_refresh":
+        save_data["force_refresh"] = True
+    
+    await write_snapshot(filename, save_data)
+    
+    print(f"[CRAWL] 크롤링 데이터 저장 완료: {filename}")
+
+def crawl_progress(api_type: str) -> ProgressLog:
+    """진행 중인 크롤링의 이벤트 로그를 반환하고, 없으면 다음 크롤링을 위한 새 로그를 만듭니다."""
+    progress = CRAWL_PROGRESS.get(api_type)
+    if progress is None or (progress.closed and not crawl_flight.running(api_type)):
+        progress = CRAWL_PROGRESS[api_type] = ProgressLog()
+    return progress
+
+async def crawl_with_progress(api_type: str, snapshot_kind: Optional[str], progress: ProgressLog):
+    """(뉴스 목록, 이 크롤링이 저장한 스냅샷 종류)를 반환합니다."""
+    try:
+        news_items = await crawl_news(api_type, snapshot_kind, progress.append)
+        progress.append("done", {"count": len(news_items)})
+        return news_items, snapshot_kind
+    except Exception as e:
+        progress.append("error", {"detail": str(e)})
+        raise
+    finally:
+        progress.close()
+
+async def run_crawl(api_type: str, snapshot_kind: Optional[str] = None):
+    """같은 api_type의 크롤링은 한 번만 실행하고, 동시에 들어온 요청은 그 결과를 함께 기다립니다."""
+    progress = crawl_progress(api_type)
+    news_items, stored_kind = await crawl_flight.do(
+        api_type, lambda: crawl_with_progress(api_type, snapshot_kind, progress)
+    )
+    # 다른 요청이 시작한 크롤링에 합류했다면 그 크롤링은 이 요청의 스냅샷을 남기지 않았으므로 같은 결과로 저장
+    if snapshot_kind and stored_kind != snapshot_kind:
+        print(f"[CRAWL] 진행 중이던 크롤링 결과로 {snapshot_kind} 스냅샷을 저장합니다.")
+        await store_crawl_snapshot(fetchers[api_type], news_items, snapshot_kind)
+    return news_items
+
 async def scheduled_news_fetch():
     print(f"[SCHEDULER] 정기 뉴스 크롤링 시작: {datetime.now()}")
+    started = time.perf_counter()
+    news_items = []
     try:
-        fetcher = fetchers["huggingface"]
-        news_items = await fetcher.fetch_news()
-        CACHE["news"] = news_items
-        CACHE["last_updated"] = time.time()
-        CACHE["last_crawled_date"] = datetime.now().strftime("%Y%m%d")
+        news_items = await run_crawl("huggingface", "auto_crawled")
+        SCHEDULER_JOBS.inc(job="daily_news_fetch", outcome="success" if news_items else "empty")
         print(f"[SCHEDULER] 정기 뉴스 크롤링 완료: {len(news_items)}개 뉴스")
-        
-        # 크롤링 후 자동 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = DATA_DIR / f"auto_crawled_{timestamp}.json"
-        
-        save_data = {
-            "version": "1.0",
-            "saved_at": datetime.now().isoformat(),
-            "crawled_at": datetime.now().isoformat(),
-            "auto_saved": True,
-            "news_count": len(news_items),
-            "news_items": news_items
-        }
-        
-        async with aiofiles.open(filename, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(save_data, ensure_ascii=False, indent=2))
-        
-        print(f"[SCHEDULER] 크롤링 데이터 자동 저장 완료: {filename}")
     except Exception as e:
+        SCHEDULER_JOBS.inc(job="daily_news_fetch", outcome="failure")
         print(f"[ERROR] 정기 뉴스 크롤링 실패: {e}")
+    finally:
+        SCHEDULER_JOB_SECONDS.observe(time.perf_counter() - started, job="daily_news_fetch")
+    if PRERENDER_CONFIG["enabled"] and news_items:
+        await scheduled_prerender(news_items)
 
-@app.on_event("startup")
-async def startup_event():
-    # 서버 시작 시 볼륨에서 캐시 데이터 로드
-    await load_cached_news_from_volume()
-    
+async def scheduled_prerender(news_items: List[dict]):
+    started = time.perf_counter()
+    try:
+        manifest = await prerender_daily_cards(news_items)
+        SCHEDULER_JOBS.inc(job="daily_prerender", outcome="success")
+        print(f"[PRERENDER] 카드 이미지 미리 렌더링 완료: {len(manifest['pages'])}페이지, {manifest['elapsed_ms']}ms")
+    except Exception as e:
+        SCHEDULER_JOBS.inc(job="daily_prerender", outcome="failure")
+        print(f"[ERROR] 카드 이미지 미리 렌더링 실패: {e}")
+    finally:
+        SCHEDULER_JOB_SECONDS.observe(time.perf_counter() - started, job="daily_prerender")
+
+async def start_browser_pool():
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        print(f"[ERROR] 브라우저 풀 시작 실패 (첫 내보내기 요청 시 재시도): {e}")
+
+async def warm_up_models():
+    for api_type, fetcher in fetchers.items():
+        try:
+            await fetcher.warm_up()
+            print(f"[STARTUP] {api_type} 모델 워밍업 완료: {fetcher.load_timings}")
+        except Exception as e:
+            print(f"[ERROR] {api_type} 모델 워밍업 실패: {e}")
+
+def become_scheduler_leader():
+    if MODEL_WARMUP:
+        app.state.warmup_task = asyncio.create_task(warm_up_models())
     scheduler.add_job(
         scheduled_news_fetch,
         CronTrigger(hour=schedule_hour, minute=schedule_minute),
@@ -282,12 +683,64 @@ async def startup_event():
         replace_existing=True
     )
     scheduler.start()
-    print(f"[SCHEDULER] 스케줄러 시작: 매일 {schedule_hour:02d}:{schedule_minute:02d}에 뉴스 크롤링")
+    print(f"[SCHEDULER] 스케줄러 시작 (pid={os.getpid()}): 매일 {schedule_hour:02d}:{schedule_minute:02d}에 뉴스 크롤링")
+
+async def wait_for_scheduler_leadership():
+    while not scheduler_lock.try_acquire():
+        await asyncio.sleep(SHARED_CACHE_CONFIG["leader_poll_interval"])
+    print("[SCHEDULER] 이전 리더 워커가 종료되어 스케줄러를 넘겨받습니다.")
+    become_scheduler_leader()
+
+@app.on_event("startup")
+async def startup_event():
+    # 서버 시작 시 스냅샷 색인을 디렉터리와 맞춘 뒤 볼륨에서 캐시 데이터 로드
+    index_result = await asyncio.to_thread(state_index.sync, snapshot_store.read)
+    print(f"[INDEX] 스냅샷 색인 동기화: {index_result}")
+    await asyncio.to_thread(prune_snapshots)
+    if not await sync_shared_cache():
+        await load_cached_news_from_volume()
+    app.state.browser_task = asyncio.create_task(start_browser_pool())
+    app.state.loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
+    
+    # 스케줄러(와 모델 워밍업)는 잠금을 잡은 워커 하나에서만 실행
+    if scheduler_lock is None or scheduler_lock.try_acquire():
+        become_scheduler_leader()
+    else:
+        print(f"[SCHEDULER] 다른 워커(pid={scheduler_lock.holder_pid()})가 스케줄러를 실행 중입니다. 대기합니다.")
+        app.state.leader_task = asyncio.create_task(wait_for_scheduler_leadership())
+    STARTUP_TIMINGS["ready_seconds"] = round(time.perf_counter() - STARTUP_STARTED, 3)
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    scheduler.shutdown()
-    print("[SCHEDULER] 스케줄러 종료")
+    app.state.loop_lag_task.cancel()
+    leader_task = getattr(app.state, "leader_task", None)
+    if leader_task:
+        leader_task.cancel()
+    if scheduler.running:
+        scheduler.shutdown()
+        print("[SCHEDULER] 스케줄러 종료")
+    if scheduler_lock:
+        scheduler_lock.release()
+    for fetcher in fetchers.values():
+        await fetcher.aclose()
+    await browser_pool.close()
+    if shared_cache:
+        shared_cache.close()
+    if render_cache:
+        render_cache.close()
+    snapshot_store.close()
+    state_log.close()
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 텍스트 형식의 메트릭"""
+    for api_type, fetcher in fetchers.items():
+        stats = fetcher.inference_stats()
+        if stats and "queue_depth" in stats:
+            INFERENCE_QUEUE_DEPTH.set(stats["queue_depth"], api_type=api_type)
+    if CACHE["news"]:
+        NEWS_CACHE_AGE.set(round(cache_age(), 3))
+    return Response(REGISTRY.render(), media_type=REGISTRY.content_type)
 
 @app.get("/api/schedule-status")
 async def get_schedule_status():
@@ -300,6 +753,13 @@ async def get_schedule_status():
             "next_run": next_run.isoformat() if next_run else None,
             "timezone": str(job.trigger.timezone) if hasattr(job.trigger, 'timezone') else None
         }
+    if scheduler_lock and not scheduler_lock.held:
+        return {
+            "status": "standby",
+            "schedule_time": f"{schedule_hour:02d}:{schedule_minute:02d}",
+            "leader_pid": scheduler_lock.holder_pid(),
+            "message": "다른 워커가 스케줄러를 실행 중입니다"
+        }
     return {
         "status": "inactive",
         "schedule_time": f"{schedule_hour:02d}:{schedule_minute:02d}",
@@ -310,51 +770,131 @@ async def get_schedule_status():
 async def save_state(state: SaveStateRequest):
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = DATA_DIR / f"state_{timestamp}.json"
+        filename = DATA_DIR / SnapshotStore.filename("state", timestamp)
         
         save_data = state.dict()
         save_data["saved_at"] = datetime.now().isoformat()
         
-        async with aiofiles.open(filename, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(save_data, ensure_ascii=False, indent=2))
+        await write_snapshot(filename, save_data)
+        revision = await asyncio.to_thread(state_log.append_full, filename.name, save_data["saved_at"], save_data)
         
-        print(f"[SAVE] 상태 저장 완료: {filename}")
+        print(f"[SAVE] 상태 저장 완료: {filename} (revision {revision})")
         return {
             "status": "success",
             "filename": filename.name,
+            "revision": revision,
             "saved_at": save_data["saved_at"]
         }
     except Exception as e:
         print(f"[ERROR] 상태 저장 실패: {e}")
         raise HTTPException(status_code=500, detail="상태 저장 중 오류가 발생했습니다")
 
+@app.patch("/api/state")
+async def patch_state(request: StatePatchRequest):
+    """base_revision 상태에 patch를 적용해 새 revision으로 저장합니다. 전체 문서 대신 변경분만 기록합니다."""
+    try:
+        head = await asyncio.to_thread(state_log.head)
+        if head == 0 or request.base_revision != head:
+            raise RevisionConflict(head)
+        saved_at = datetime.now().isoformat()
+        patch = {**request.patch, "saved_at": saved_at}
+        base = await asyncio.to_thread(state_log.rebuild, request.base_revision, load_state_checkpoint)
+        data = merge_patch(base, patch)
+        SaveStateRequest(**data)
+        revision = await asyncio.to_thread(state_log.append_patch, request.base_revision, patch, saved_at, data)
+    except RevisionConflict as e:
+        message = "먼저 전체 상태를 저장해야 합니다" if e.head == 0 else str(e)
+        raise HTTPException(status_code=409, detail={"message": message, "head": e.head})
+    except RevisionUnavailable as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"patch 적용 결과가 올바른 상태가 아닙니다: {e}")
+    except Exception as e:
+        print(f"[ERROR] 상태 patch 저장 실패: {e}")
+        raise HTTPException(status_code=500, detail="상태 저장 중 오류가 발생했습니다")
+    
+    pending, pending_bytes = await asyncio.to_thread(state_log.pending)
+    if pending >= STATE_LOG_CONFIG["compact_every"] or pending_bytes >= STATE_LOG_CONFIG["compact_bytes"]:
+        schedule_state_compaction()
+    return {
+        "status": "success",
+        "revision": revision,
+        "base_revision": request.base_revision,
+        "saved_at": saved_at
+    }
+
+def schedule_state_compaction():
+    if COMPACTION_TASKS:
+        return
+    task = asyncio.create_task(compact_state_log())
+    COMPACTION_TASKS.add(task)
+    task.add_done_callback(COMPACTION_TASKS.discard)
+
+async def compact_state_log():
+    """최신 revision을 전체 스냅샷으로 저장해, 이후 불러오기가 그 뒤의 patch만 적용하도록 합니다."""
+    try:
+        revision = await asyncio.to_thread(state_log.head)
+        data = await asyncio.to_thread(state_log.rebuild, revision, load_state_checkpoint)
+        filename = DATA_DIR / SnapshotStore.filename("state", datetime.now().strftime("%Y%m%d_%H%M%S"))
+        if filename.exists():
+            return  # 같은 초에 저장된 스냅샷이 있으면 다음 patch 때 다시 시도
+        await write_snapshot(filename, data)
+        await asyncio.to_thread(state_log.mark_checkpoint, revision, filename.name)
+        print(f"[SAVE] 상태 변경분 압축 완료: revision {revision} → {filename.name}")
+    except Exception as e:
+        print(f"[ERROR] 상태 변경분 압축 실패: {e}")
+
 @app.get("/api/state")
-async def load_state(filename: Optional[str] = None):
+async def load_state(request: Request, filename: Optional[str] = None, revision: Optional[int] = None):
     try:
+        head = await asyncio.to_thread(state_log.head)
+        if revision is not None or (not filename and head):
+            revision = head if revision is None else revision
+            state_data = await asyncio.to_thread(state_log.rebuild, revision, load_state_checkpoint)
+            print(f"[LOAD] 상태 불러오기 완료: revision {revision}")
+            return conditional_response(
+                request,
+                encode_json({
+                    "status": "success",
+                    "data": state_data,
+                    "filename": await asyncio.to_thread(state_log.filename_for, revision),
+                    "revision": revision,
+                    "head": head
+                })
+            )
+        
         if filename:
             filepath = DATA_DIR / filename
         else:
-            files = sorted(DATA_DIR.glob("state_*.json"), reverse=True)
-            if not files:
+            latest = await asyncio.to_thread(state_index.latest, ["state"])
+            if not latest:
                 return {
                     "status": "no_data",
                     "message": "저장된 상태가 없습니다"
                 }
-            filepath = files[0]
+            filepath = DATA_DIR / latest["filename"]
         
         if not filepath.exists():
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
         
-        async with aiofiles.open(filepath, "r", encoding="utf-8") as f:
-            content = await f.read()
-            state_data = json.loads(content)
+        state_data = await read_snapshot(filepath)
         
         print(f"[LOAD] 상태 불러오기 완료: {filepath.name}")
-        return {
-            "status": "success",
-            "data": state_data,
-            "filename": filepath.name
-        }
+        return conditional_response(
+            request,
+            encode_json({
+                "status": "success",
+                "data": state_data,
+                "filename": filepath.name,
+                "revision": await asyncio.to_thread(state_log.revision_for, filepath.name),
+                "head": head
+            }),
+            last_modified=filepath.stat().st_mtime
+        )
+    except HTTPException:
+        raise
+    except RevisionUnavailable as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
     except Exception as e:
@@ -362,163 +902,441 @@ async def load_state(filename: Optional[str] = None):
         raise HTTPException(status_code=500, detail="상태 불러오기 중 오류가 발생했습니다")
 
 @app.get("/api/state/list")
-async def list_saved_states():
+async def list_saved_states(
+    request: Request,
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    kind: str = "state",
+    date: Optional[str] = None
+):
     try:
-        files = sorted(DATA_DIR.glob("state_*.json"), reverse=True)
-        states = []
-        
-        for file in files[:20]:
-            async with aiofiles.open(file, "r", encoding="utf-8") as f:
-                content = await f.read()
-                data = json.loads(content)
-                states.append({
-                    "filename": file.name,
-                    "saved_at": data.get("saved_at"),
-                    "version": data.get("version", "1.0")
-                })
+        rows, total = await asyncio.to_thread(state_index.list, [kind], date, limit, offset)
+        states = [
+            {
+                "filename": row["filename"],
+                "saved_at": row["saved_at"],
+                "version": row["version"] or "1.0",
+                "kind": row["kind"],
+                "news_count": row["news_count"]
+            }
+            for row in rows
+        ]
         
-        return {
+        return conditional_response(request, encode_json({
             "status": "success",
             "states": states,
-            "total": len(states)
-        }
+            "total": len(states),
+            "total_available": total,
+            "limit": limit,
+            "offset": offset,
+            "has_more": offset + len(states) < total
+        }))
     except Exception as e:
         print(f"[ERROR] 상태 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="상태 목록 조회 중 오류가 발생했습니다")
 
-@app.post("/api/export")
-async def export_content(request: ExportRequest):
+def session_manifest(session_id: str) -> Path:
+    if not SESSION_ID_PATTERN.match(session_id):
+        raise HTTPException(status_code=400, detail="잘못된 세션 ID입니다")
+    return SESSION_DIR / f"{session_id}.txt"
+
+async def register_session_file(session_id: str, filename: str):
+    manifest = session_manifest(session_id)
+    SESSION_DIR.mkdir(parents=True, exist_ok=True)
+    async with aiofiles.open(manifest, "a", encoding="utf-8") as f:
+        await f.write(f"{filename}\n")
+
+def resolve_output_files(filenames: List[str]) -> List[Path]:
+    files = []
+    for name in filenames:
+        path = OUTPUT_DIR / name
+        if Path(name).name != name or not path.is_file():
+            raise HTTPException(status_code=404, detail=f"이미지를 찾을 수 없습니다: {name}")
+        files.append(path)
+    return files
+
+async def render_export(request: ExportRequest, timestamp: str, output_dir: Path = OUTPUT_DIR):
+    started = time.perf_counter()
     try:
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        output_dir = Path("./output")
-        output_dir.mkdir(exist_ok=True)
+        result = await render_page_cached(request, timestamp, output_dir)
+    except Exception:
+        EXPORT_RENDER_SECONDS.observe(
+            time.perf_counter() - started, format=request.export_format, method="browser", outcome="error"
+        )
+        raise
+    method = "file" if result["format"] == "html" else result.get("method", "browser")
+    EXPORT_RENDER_SECONDS.observe(
+        time.perf_counter() - started, format=result["format"], method=method, outcome="success"
+    )
+    if request.session_id and result["format"] == "png":
+        await register_session_file(request.session_id, result["filename"])
+    return result
+
+async def render_page_cached(request: ExportRequest, timestamp: str, output_dir: Path = OUTPUT_DIR):
+    """브라우저로 렌더링한 PNG/PDF는 HTML과 설정의 해시로 캐시해, 같은 페이지를 다시 내보내면 기존 결과를 재사용합니다.
+
+    캐시 파일은 RENDER_CACHE_DIR에 따로 두고, 요청마다 자기 페이지 이름의 파일로 연결해 돌려줍니다.
+    OUTPUT_DIR이 아닌 디렉터리로 렌더링할 때는 캐시를 쓰지 않습니다.
+    """
+    if render_cache is None or output_dir != OUTPUT_DIR or request.export_format not in ("png", "pdf"):
+        return await render_page(request, timestamp, output_dir)
+    key = RenderCache.make_key(request.html_content, request.export_format, RENDER_SETTINGS)
+    filename = f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.{request.export_format}"
+    cached = await asyncio.to_thread(render_cache.get, key)
+    EXPORT_CACHE_REQUESTS.inc(result="hit" if cached else "miss")
+    if cached:
+        await asyncio.to_thread(link_artifact, RENDER_CACHE_DIR / cached["filename"], OUTPUT_DIR / filename)
+        print(f"[EXPORT] 렌더링 캐시 사용: {cached['filename']} -> {filename}")
+        return {"status": "success", "filename": filename, "format": cached["format"], "method": "cache"}
+    result = await render_flight.do(key, lambda: render_and_cache(key, request, timestamp))
+    if result["filename"] != filename:
+        # 같은 HTML을 동시에 요청해 다른 요청의 렌더링 결과를 받은 경우
+        await asyncio.to_thread(link_artifact, OUTPUT_DIR / result["filename"], OUTPUT_DIR / filename)
+        result = {**result, "filename": filename}
+    return result
+
+async def render_and_cache(key: str, request: ExportRequest, timestamp: str):
+    result = await render_page(request, timestamp)
+    # 브라우저 실패 시의 대체 이미지는 캐시하지 않음
+    if result.get("method", "browser") == "browser":
+        cached_name = f"{key}.{result['format']}"
+        await asyncio.to_thread(link_artifact, OUTPUT_DIR / result["filename"], RENDER_CACHE_DIR / cached_name)
+        await asyncio.to_thread(render_cache.put, key, cached_name, result["format"])
+    return result
+
+def link_artifact(source: Path, target: Path):
+    """source를 target 이름으로 하드 링크합니다 (지원하지 않는 파일 시스템이면 복사). 한쪽을 지워도 다른 쪽은 남습니다."""
+    temp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temp.unlink(missing_ok=True)
+    try:
+        os.link(source, temp)
+    except OSError:
+        shutil.copyfile(source, temp)
+    os.replace(temp, target)
+
+async def render_page(request: ExportRequest, timestamp: str, output_dir: Path = OUTPUT_DIR):
+    if request.export_format == "html":
+        filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.html"
+        async with aiofiles.open(filename, "w", encoding="utf-8") as f:
+            await f.write(request.html_content)
         
-        if request.export_format == "html":
-            filename = output_dir / f"geek_news_{request.page_type}_{timestamp}.html"
-            async with aiofiles.open(filename, "w", encoding="utf-8") as f:
-                await f.write(request.html_content)
-            
-            print(f"[EXPORT] HTML 저장 완료: {filename}")
+        print(f"[EXPORT] HTML 저장 완료: {filename}")
+        return {
+            "status": "success",
+            "filename": filename.name,
+            "format": "html"
+        }
+    
+    elif request.export_format in ["png", "pdf"]:
+        # Playwright가 실패하면 간단한 이미지 생성으로 대체
+        try:
+            async with browser_pool.page() as page:
+                await page.set_content(request.html_content)
+                await page.wait_for_load_state('networkidle')
+                
+                if request.export_format == "png":
+                    filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.png"
+                    await page.screenshot(path=str(filename), full_page=False)
+                    print(f"[EXPORT] PNG 저장 완료: {filename}")
+                
+                elif request.export_format == "pdf":
+                    filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.pdf"
+                    await page.pdf(
+                        path=str(filename),
+                        format='A4',
+                        print_background=True,
+                        margin={'top': '0', 'right': '0', 'bottom': '0', 'left': '0'}
+                    )
+                    print(f"[EXPORT] PDF 저장 완료: {filename}")
+                
             return {
                 "status": "success",
                 "filename": filename.name,
-                "format": "html"
+                "format": request.export_format
             }
-        
-        elif request.export_format in ["png", "pdf"]:
-            # Playwright가 실패하면 간단한 이미지 생성으로 대체
-            try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    page = await browser.new_page(viewport={'width': 1080, 'height': 1080})
-                    
-                    await page.set_content(request.html_content)
-                    await page.wait_for_load_state('networkidle')
-                    
-                    if request.export_format == "png":
-                        filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.png"
-                        await page.screenshot(path=str(filename), full_page=False)
-                        print(f"[EXPORT] PNG 저장 완료: {filename}")
-                    
-                    elif request.export_format == "pdf":
-                        filename = output_dir / f"geek_news_{request.page_type}_{timestamp}.pdf"
-                        await page.pdf(
-                            path=str(filename),
-                            format='A4',
-                            print_background=True,
-                            margin={'top': '0', 'right': '0', 'bottom': '0', 'left': '0'}
-                        )
-                        print(f"[EXPORT] PDF 저장 완료: {filename}")
-                    
-                    await browser.close()
-                    
+        except Exception as browser_error:
+            print(f"[WARNING] Playwright 실행 실패, 대체 방법 사용: {browser_error}")
+            
+            # 캐시된 뉴스 데이터로 간단한 이미지 생성
+            if request.export_format == "png" and CACHE["news"]:
+                from PIL import Image, ImageDraw
+                filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.png"
+                
+                # 간단한 이미지 생성 (1080x1080)
+                img = Image.new('RGB', (1080, 1080), color=(33, 33, 33))
+                draw = ImageDraw.Draw(img)
+                
+                # 제목 텍스트
+                title_text = f"GeekNews - {request.page_type.upper()}"
+                draw.text((540, 100), title_text, fill=(255, 255, 255), anchor="mm")
+                
+                # 날짜
+                date_text = datetime.now().strftime("%Y-%m-%d")
+                draw.text((540, 150), date_text, fill=(200, 200, 200), anchor="mm")
+                
+                # 뉴스 개수 정보
+                if CACHE["news"]:
+                    info_text = f"캐시된 뉴스: {len(CACHE['news'])}개"
+                    draw.text((540, 540), info_text, fill=(150, 150, 150), anchor="mm")
+                
+                img.save(filename)
+                print(f"[EXPORT] 대체 PNG 저장 완료: {filename}")
+                
                 return {
                     "status": "success",
                     "filename": filename.name,
-                    "format": request.export_format
+                    "format": "png",
+                    "method": "fallback"
                 }
-            except Exception as browser_error:
-                print(f"[WARNING] Playwright 실행 실패, 대체 방법 사용: {browser_error}")
-                
-                # 캐시된 뉴스 데이터로 간단한 이미지 생성
-                if request.export_format == "png" and CACHE["news"]:
-                    filename = output_dir / f"geek_news_{request.page_type}_{request.page_index:02d}_{timestamp}.png"
-                    
-                    # 간단한 이미지 생성 (1080x1080)
-                    img = Image.new('RGB', (1080, 1080), color=(33, 33, 33))
-                    draw = ImageDraw.Draw(img)
-                    
-                    # 제목 텍스트
-                    title_text = f"GeekNews - {request.page_type.upper()}"
-                    draw.text((540, 100), title_text, fill=(255, 255, 255), anchor="mm")
-                    
-                    # 날짜
-                    date_text = datetime.now().strftime("%Y-%m-%d")
-                    draw.text((540, 150), date_text, fill=(200, 200, 200), anchor="mm")
-                    
-                    # 뉴스 개수 정보
-                    if CACHE["news"]:
-                        info_text = f"캐시된 뉴스: {len(CACHE['news'])}개"
-                        draw.text((540, 540), info_text, fill=(150, 150, 150), anchor="mm")
-                    
-                    img.save(filename)
-                    print(f"[EXPORT] 대체 PNG 저장 완료: {filename}")
-                    
-                    return {
-                        "status": "success",
-                        "filename": filename.name,
-                        "format": "png",
-                        "method": "fallback"
-                    }
-                else:
-                    raise HTTPException(status_code=500, detail=f"내보내기 실패: {browser_error}")
-        
-        else:
-            raise HTTPException(status_code=400, detail="지원하지 않는 형식입니다")
-            
+            else:
+                raise HTTPException(status_code=500, detail=f"내보내기 실패: {browser_error}")
+    
+    else:
+        raise HTTPException(status_code=400, detail="지원하지 않는 형식입니다")
+
+@app.post("/api/export")
+async def export_content(request: ExportRequest):
+    try:
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        return await render_export(request, timestamp)
     except Exception as e:
         print(f"[ERROR] 내보내기 실패: {e}")
         raise HTTPException(status_code=500, detail="내보내기 중 오류가 발생했습니다")
 
-@app.post("/api/export/combine-images")
-async def combine_images():
+@app.post("/api/export/batch")
+async def export_batch(request: BatchExportRequest):
+    if not request.items:
+        raise HTTPException(status_code=400, detail="내보낼 페이지가 없습니다")
     try:
-        output_dir = Path("./output")
-        image_files = sorted(output_dir.glob("geek_news_*_*.png"))
-        
-        if not image_files:
-            raise HTTPException(status_code=404, detail="결합할 이미지가 없습니다")
+        started = time.perf_counter()
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        OUTPUT_DIR.mkdir(exist_ok=True)
+        results = await asyncio.gather(
+            *(render_export(item, timestamp) for item in request.items),
+            return_exceptions=True
+        )
         
-        images = []
-        for img_file in image_files:
-            img = Image.open(img_file)
-            images.append(img)
+        artifacts = []
+        for index, (item, result) in enumerate(zip(request.items, results)):
+            if isinstance(result, Exception):
+                message = result.detail if isinstance(result, HTTPException) else str(result)
+                print(f"[ERROR] 일괄 내보내기 실패 ({item.page_type} #{item.page_index}): {message}")
+                artifacts.append({"index": index, "status": "error", "page_type": item.page_type, "message": message})
+            else:
+                artifacts.append({"index": index, "page_type": item.page_type, **result})
         
-        total_height = sum(img.height for img in images)
-        max_width = max(img.width for img in images)
+        png_files = [
+            OUTPUT_DIR / artifact["filename"]
+            for artifact in artifacts
+            if artifact["status"] == "success" and artifact["format"] == "png"
+        ]
+        combined = None
+        if request.combine and png_files:
+            extension = "jpg" if request.combine_format == "jpeg" else request.combine_format
+            combined_path, size = await asyncio.to_thread(
+                combine_image_files, png_files, OUTPUT_DIR / f"geek_news_combined_{timestamp}.{extension}",
+                request.combine_format, request.combine_max_width
+            )
+            combined = {"filename": combined_path.name, "total_pages": len(png_files), "width": size[0], "height": size[1]}
+            print(f"[EXPORT] 이미지 결합 완료: {combined_path}")
+        pdf = None
+        if request.pdf and png_files:
+            pdf_path = await asyncio.to_thread(
+                images_to_pdf, png_files, OUTPUT_DIR / f"geek_news_pages_{timestamp}.pdf"
+            )
+            pdf = {"filename": pdf_path.name, "total_pages": len(png_files)}
+            print(f"[EXPORT] 다중 페이지 PDF 저장 완료: {pdf_path}")
         
-        combined_image = Image.new('RGB', (max_width, total_height))
-        y_offset = 0
+        failed = sum(1 for artifact in artifacts if artifact["status"] != "success")
+        return {
+            "status": "success" if not failed else "partial",
+            "artifacts": artifacts,
+            "combined": combined,
+            "pdf": pdf,
+            "total": len(artifacts),
+            "failed": failed,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000)
+        }
+    except Exception as e:
+        print(f"[ERROR] 일괄 내보내기 실패: {e}")
+        raise HTTPException(status_code=500, detail="일괄 내보내기 중 오류가 발생했습니다")
+
+@app.post("/api/export/combine-images")
+async def combine_images(request: Optional[CombineImagesRequest] = None):
+    request = request or CombineImagesRequest()
+    try:
+        if request.filenames:
+            image_files = resolve_output_files(request.filenames)
+        elif request.session_id:
+            manifest = session_manifest(request.session_id)
+            if not manifest.exists():
+                raise HTTPException(status_code=404, detail="내보내기 세션을 찾을 수 없습니다")
+            async with aiofiles.open(manifest, "r", encoding="utf-8") as f:
+                names = [line.strip() for line in (await f.read()).splitlines() if line.strip()]
+            image_files = resolve_output_files(list(dict.fromkeys(names)))
+        else:
+            image_files = [
+                path for path in sorted(OUTPUT_DIR.glob("geek_news_*_*.png"))
+                if not path.name.startswith("geek_news_combined_")
+            ]
         
-        for img in images:
-            combined_image.paste(img, (0, y_offset))
-            y_offset += img.height
+        if not image_files:
+            raise HTTPException(status_code=404, detail="결합할 이미지가 없습니다")
+        if request.output_format not in ("png", "jpeg", "webp"):
+            raise HTTPException(status_code=400, detail="지원하지 않는 형식입니다")
         
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        combined_filename = output_dir / f"geek_news_combined_{timestamp}.png"
-        combined_image.save(combined_filename)
+        extension = "jpg" if request.output_format == "jpeg" else request.output_format
+        combined_filename = OUTPUT_DIR / f"geek_news_combined_{timestamp}.{extension}"
+        _, size = await asyncio.to_thread(
+            combine_image_files, image_files, combined_filename,
+            request.output_format, request.max_width, request.quality
+        )
         
         print(f"[EXPORT] 이미지 결합 완료: {combined_filename}")
         return {
             "status": "success",
             "filename": combined_filename.name,
-            "total_pages": len(images)
+            "total_pages": len(image_files),
+            "format": request.output_format,
+            "width": size[0],
+            "height": size[1]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"[ERROR] 이미지 결합 실패: {e}")
         raise HTTPException(status_code=500, detail="이미지 결합 중 오류가 발생했습니다")
 
+async def prerender_daily_cards(news_items: List[dict], date: Optional[datetime] = None):
+    """뉴스 목록으로 카드 페이지를 렌더링하고 결합 이미지와 함께 output/daily/YYYYMMDD/에 저장합니다.
+
+    임시 디렉터리에 모두 만든 뒤 바꿔 넣으므로, 렌더링 도중에도 이전 결과가 그대로 제공됩니다.
+    """
+    date = date or datetime.now()
+    day = date.strftime("%Y%m%d")
+    async with prerender_lock.hold():
+        started = time.perf_counter()
+        staging = DAILY_DIR / f".{day}.tmp"
+        await asyncio.to_thread(shutil.rmtree, staging, True)
+        staging.mkdir(parents=True)
+        timestamp = date.strftime("%Y%m%d%H%M%S")
+        pages = [ExportRequest(**page, export_format="png") for page in build_card_pages(news_items, date)]
+        results = await asyncio.gather(
+            *(render_export(page, timestamp, staging) for page in pages),
+            return_exceptions=True
+        )
+        # 브라우저 대신 PIL 대체 이미지로 만들어진 페이지도 실패로 보고 이전 날짜 디렉터리를 유지
+        errors = [
+            result if isinstance(result, Exception) else RuntimeError(f"브라우저 렌더링 실패 (method={result.get('method')})")
+            for result in results
+            if isinstance(result, Exception) or result.get("method", "browser") != "browser"
+        ]
+        if errors:
+            await asyncio.to_thread(shutil.rmtree, staging, True)
+            message = errors[0].detail if isinstance(errors[0], HTTPException) else str(errors[0])
+            raise RuntimeError(f"{len(errors)}/{len(pages)}페이지 렌더링 실패: {message}")
+
+        combine_format = PRERENDER_CONFIG["combine_format"]
+        extension = "jpg" if combine_format == "jpeg" else combine_format
+        combined_path, size = await asyncio.to_thread(
+            combine_image_files, [staging / result["filename"] for result in results],
+            staging / f"geek_news_combined_{day}.{extension}", combine_format, PRERENDER_CONFIG["combine_max_width"]
+        )
+        manifest = {
+            "date": day,
+            "rendered_at": datetime.now().isoformat(),
+            "news_count": len(news_items),
+            "pages": [
+                {
+                    "page_type": page.page_type,
+                    "page_index": page.page_index,
+                    "filename": result["filename"],
+                    "method": result.get("method", "browser")
+                }
+                for page, result in zip(pages, results)
+            ],
+            "combined": {"filename": combined_path.name, "format": combine_format, "width": size[0], "height": size[1]},
+            "elapsed_ms": round((time.perf_counter() - started) * 1000)
+        }
+        async with aiofiles.open(staging / "manifest.json", "w", encoding="utf-8") as f:
+            await f.write(json.dumps(manifest, ensure_ascii=False, indent=2))
+        await asyncio.to_thread(replace_daily_dir, staging, DAILY_DIR / day)
+        await asyncio.to_thread(prune_daily_dirs, PRERENDER_CONFIG["keep_days"])
+    return manifest
+
+def replace_daily_dir(staging: Path, target: Path):
+    previous = target.with_name(f".{target.name}.old")
+    shutil.rmtree(previous, ignore_errors=True)
+    if target.exists():
+        target.rename(previous)
+    staging.rename(target)
+    shutil.rmtree(previous, ignore_errors=True)
+
+def prune_daily_dirs(keep_days: int):
+    cutoff = (datetime.now() - timedelta(days=keep_days)).strftime("%Y%m%d")
+    for path in DAILY_DIR.iterdir():
+        if path.is_dir() and DAILY_DATE_PATTERN.match(path.name) and path.name < cutoff:
+            shutil.rmtree(path, ignore_errors=True)
+            print(f"[PRERENDER] 오래된 카드 이미지 삭제: {path}")
+
+def daily_dates() -> List[str]:
+    if not DAILY_DIR.is_dir():
+        return []
+    return sorted(
+        (path.name for path in DAILY_DIR.iterdir() if DAILY_DATE_PATTERN.match(path.name) and (path / "manifest.json").is_file()),
+        reverse=True
+    )
+
+def resolve_daily_dir(date: str) -> Path:
+    if date == "latest":
+        dates = daily_dates()
+        if not dates:
+            raise HTTPException(status_code=404, detail="미리 렌더링된 카드 이미지가 없습니다")
+        date = dates[0]
+    if not DAILY_DATE_PATTERN.match(date) or not (DAILY_DIR / date / "manifest.json").is_file():
+        raise HTTPException(status_code=404, detail=f"{date} 날짜의 카드 이미지가 없습니다")
+    return DAILY_DIR / date
+
+@app.get("/api/daily")
+async def list_daily_cards():
+    dates = await asyncio.to_thread(daily_dates)
+    return {"status": "success", "enabled": PRERENDER_CONFIG["enabled"], "dates": dates, "total": len(dates)}
+
+@app.get("/api/daily/{date}")
+async def get_daily_cards(date: str):
+    directory = resolve_daily_dir(date)
+    async with aiofiles.open(directory / "manifest.json", "r", encoding="utf-8") as f:
+        manifest = json.loads(await f.read())
+    base = f"/api/daily/{directory.name}"
+    for page in manifest["pages"]:
+        page["url"] = f"{base}/{page['filename']}"
+    manifest["combined"]["url"] = f"{base}/{manifest['combined']['filename']}"
+    return {"status": "success", **manifest}
+
+@app.get("/api/daily/{date}/{filename}")
+async def get_daily_card_file(date: str, filename: str):
+    path = resolve_daily_dir(date) / filename
+    if Path(filename).name != filename or filename == "manifest.json" or not path.is_file():
+        raise HTTPException(status_code=404, detail=f"이미지를 찾을 수 없습니다: {filename}")
+    return FileResponse(path, headers={"Cache-Control": "public, max-age=3600"})
+
+@app.post("/api/daily/render")
+async def render_daily_cards():
+    if not await sync_shared_cache() and not CACHE["news"]:
+        await load_cached_news_from_volume()
+    news_items = CACHE["news"]
+    if not news_items:
+        raise HTTPException(status_code=404, detail="렌더링할 뉴스가 없습니다")
+    try:
+        manifest = await prerender_daily_cards(news_items)
+    except Exception as e:
+        print(f"[ERROR] 카드 이미지 렌더링 실패: {e}")
+        raise HTTPException(status_code=500, detail="카드 이미지 렌더링 중 오류가 발생했습니다")
+    return {"status": "success", **manifest}
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
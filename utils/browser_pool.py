@@ -0,0 +1,183 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+
+class BrowserPool:
+    def __init__(self, size=2, viewport=None, acquire_timeout=30, health_check_interval=30):
+        self.size = max(1, size)
+        self.viewport = viewport or {"width": 1080, "height": 1080}
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._playwright = None
+        self._browser = None
+        self._generation = 0
+        self._pages = asyncio.Queue()
+        self._live = 0  # 현재 세대에서 살아 있는 페이지 수 (대여 중인 페이지 포함)
+        self._lock = asyncio.Lock()
+        self._health_task = None
+        self._closed = False
+        self.last_error = None
+        self.stats = {"launches": 0, "restarts": 0, "renders": 0, "failures": 0, "page_replacements": 0}
+
+    async def start(self):
+        self._closed = False
+        await self._ensure_browser()
+        if self.health_check_interval and (self._health_task is None or self._health_task.done()):
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def close(self):
+        self._closed = True
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        async with self._lock:
+            await self._close_browser()
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+        print("[BROWSER] 브라우저 풀 종료")
+
+    def is_healthy(self):
+        return bool(self._browser and self._browser.is_connected())
+
+    def status(self):
+        return {
+            "healthy": self.is_healthy(),
+            "size": self.size,
+            "idle_pages": self._pages.qsize(),
+            "live_pages": self._live,
+            "generation": self._generation,
+            "last_error": self.last_error,
+            **self.stats
+        }
+
+    @asynccontextmanager
+    async def page(self):
+        await self._ensure_browser()
+        generation, page = await asyncio.wait_for(self._pages.get(), self.acquire_timeout)
+        reusable = True
+        try:
+            yield page
+            self.stats["renders"] += 1
+        except Exception:
+            reusable = False
+            self.stats["failures"] += 1
+            raise
+        finally:
+            await self._release(generation, page, reusable)
+
+    async def _release(self, generation, page, reusable):
+        if generation != self._generation:
+            await self._dispose(page)
+            return
+        if reusable and not page.is_closed():
+            self._pages.put_nowait((generation, page))
+            return
+        await self._dispose(page)
+        self._live -= 1
+        if not self.is_healthy():
+            return
+        # 새 페이지를 만드는 동안 보충 작업이 같은 자리를 채우지 않도록 먼저 자리를 잡아 둠
+        self._live += 1
+        try:
+            new_page = await self._new_page()
+        except Exception as e:
+            self._live -= 1
+            self.last_error = str(e)
+            print(f"[ERROR] 브라우저 페이지 교체 실패 (다음 요청이나 상태 확인 때 다시 채움): {e}")
+            return
+        if generation != self._generation:
+            await self._dispose(new_page)
+            return
+        self._pages.put_nowait((generation, new_page))
+        self.stats["page_replacements"] += 1
+
+    async def _top_up(self):
+        """교체에 실패해 줄어든 페이지를 size개까지 다시 채웁니다."""
+        async with self._lock:
+            generation = self._generation
+            while self.is_healthy() and generation == self._generation and self._live < self.size:
+                self._live += 1
+                try:
+                    page = await self._new_page()
+                except Exception as e:
+                    self._live -= 1
+                    self.last_error = str(e)
+                    print(f"[ERROR] 브라우저 페이지 보충 실패: {e}")
+                    return
+                self._pages.put_nowait((generation, page))
+                self.stats["page_replacements"] += 1
+
+    async def _ensure_browser(self):
+        if self.is_healthy():
+            if self._live < self.size:
+                await self._top_up()
+            return
+        async with self._lock:
+            if self.is_healthy():
+                return
+            if self._closed:
+                raise RuntimeError("브라우저 풀이 종료되었습니다")
+            if self._browser is not None:
+                self.stats["restarts"] += 1
+                print("[BROWSER] 브라우저 연결이 끊어져 재시작합니다.")
+            await self._close_browser()
+            await self._launch()
+
+    async def _launch(self):
+        from playwright.async_api import async_playwright
+        started = time.perf_counter()
+        try:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._generation += 1
+            while not self._pages.empty():
+                self._pages.get_nowait()
+            self._live = 0
+            for _ in range(self.size):
+                self._pages.put_nowait((self._generation, await self._new_page()))
+                self._live += 1
+        except Exception as e:
+            self.last_error = str(e)
+            # 페이지를 다 만들지 못한 브라우저는 닫아서 다음 요청이 처음부터 다시 시작하게 함
+            await self._close_browser()
+            raise
+        self.stats["launches"] += 1
+        self.last_error = None
+        print(f"[BROWSER] 브라우저 시작 완료: 페이지 {self.size}개, {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    async def _new_page(self):
+        context = await self._browser.new_context(viewport=self.viewport)
+        return await context.new_page()
+
+    async def _dispose(self, page):
+        try:
+            await page.context.close()
+        except Exception:
+            pass
+
+    async def _close_browser(self):
+        browser, self._browser = self._browser, None
+        self._live = 0
+        while not self._pages.empty():
+            self._pages.get_nowait()
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def _health_loop(self):
+        while not self._closed:
+            await asyncio.sleep(self.health_check_interval)
+            if self.is_healthy():
+                if self._live < self.size:
+                    await self._top_up()
+                continue
+            try:
+                await self._ensure_browser()
+            except Exception as e:
+                print(f"[ERROR] 브라우저 재시작 실패: {e}")
@@ -0,0 +1,74 @@
+from datetime import datetime
+from html import escape
+from pathlib import Path
+from urllib.parse import urlparse
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+NEWS_PER_PAGE = 2
+
+
+def _template(name):
+    return (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+
+
+def _document(body, css):
+    return (
+        "<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'>"
+        f"<style>{css}</style></head><body>{body}</body></html>"
+    )
+
+
+def _category(item):
+    return urlparse(item.get("source_url") or "").netloc.removeprefix("www.") or "GeekNews"
+
+
+def build_card_pages(news_items, date=None, news_prefix="GeekNews"):
+    """뉴스 목록으로 표지, 뉴스(2개씩), 요약 카드의 HTML을 만듭니다. 각 항목은 ExportRequest 필드와 같습니다."""
+    date = date or datetime.now()
+    css = _template("style.css")
+    pages = [{
+        "page_type": "cover",
+        "page_index": 0,
+        "html_content": _document(_template("cover_template.html").format(
+            cover_subtitle=escape(date.strftime("%Y.%m.%d")),
+            cover_title=escape(f"오늘의 {news_prefix}"),
+            character_image="",
+            qr_section=""
+        ), css)
+    }]
+
+    news_template = _template("news_template.html")
+    for start in range(0, len(news_items), NEWS_PER_PAGE):
+        pair = news_items[start:start + NEWS_PER_PAGE]
+        fields = {"news_prefix": escape(news_prefix), "character_src": ""}
+        for offset in range(NEWS_PER_PAGE):
+            item = pair[offset] if offset < len(pair) else {}
+            position = offset + 1
+            fields[f"number{position}"] = start + position if item else ""
+            fields[f"category{position}"] = escape(_category(item)) if item else ""
+            fields[f"title{position}"] = escape(item.get("title", ""))
+            fields[f"summary{position}"] = escape(item.get("description", ""))
+        pages.append({
+            "page_type": "news",
+            "page_index": start // NEWS_PER_PAGE + 1,
+            "html_content": _document(news_template.format(**fields), css)
+        })
+
+    item_template = _template("summary_item_template.html")
+    summary_items = "".join(
+        item_template.format(number=index + 1, category=escape(_category(item)), title=escape(item.get("title", "")))
+        for index, item in enumerate(news_items)
+    )
+    pages.append({
+        "page_type": "summary",
+        "page_index": len(pages),
+        "html_content": _document(_template("summary_template.html").format(
+            summary_title=escape(f"{news_prefix} 요약"),
+            summary_date=escape(date.strftime("%Y.%m.%d")),
+            summary_subtitle=escape(f"오늘의 뉴스 {len(news_items)}개"),
+            summary_items=summary_items,
+            summary_footer="",
+            summary_source="news.hada.io"
+        ), css)
+    })
+    return pages
@@ -0,0 +1,116 @@
+import math
+import threading
+import time
+from collections import namedtuple
+
+DecodingPlan = namedtuple(
+    "DecodingPlan", ["level", "num_beams", "max_input_length", "max_output_length", "min_output_length"]
+)
+
+
+class DecodingPlanner:
+    """지연 시간 예산 안에 요약이 끝나도록 항목마다 빔 수, 입력 자르기 길이, 출력 길이를 고릅니다.
+
+    levels는 품질이 높은 순서의 디코딩 단계 목록이고, 마지막 단계(보통 greedy)는 예산이 모자랄 때의 하한입니다.
+    처리량은 배치마다 측정한 '비용 단위당 초'의 EWMA로 추정합니다. 비용 단위는
+    입력 토큰 수 + decode_weight × 빔 수 × 출력 토큰 수입니다.
+    """
+
+    def __init__(self, levels, crawl_budget_seconds=None, item_budget_seconds=None,
+                 decode_weight=4.0, alpha=0.3, output_ratio=0.5, length_step=32):
+        if not levels:
+            raise ValueError("디코딩 단계가 비어 있습니다")
+        self.levels = levels
+        self.crawl_budget_seconds = crawl_budget_seconds
+        self.item_budget_seconds = item_budget_seconds
+        self.decode_weight = decode_weight
+        self.alpha = alpha
+        self.output_ratio = output_ratio
+        self.length_step = length_step
+        self.max_input_length = max(level["max_input_length"] for level in levels)
+        self._lock = threading.Lock()
+        self._seconds_per_unit = None
+        self._deadline = None
+        self._remaining_items = 0
+        self.level_counts = [0] * len(levels)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            config["levels"],
+            crawl_budget_seconds=config["crawl_budget_seconds"],
+            item_budget_seconds=config["item_budget_seconds"],
+            decode_weight=config["decode_weight"],
+            alpha=config["ewma_alpha"],
+            output_ratio=config["output_ratio"],
+            length_step=config["length_step"]
+        )
+
+    def start_crawl(self, item_count, started=None):
+        with self._lock:
+            self._remaining_items = item_count
+            self._deadline = (started or time.perf_counter()) + self.crawl_budget_seconds if self.crawl_budget_seconds else None
+
+    def item_done(self):
+        with self._lock:
+            self._remaining_items = max(0, self._remaining_items - 1)
+
+    def finish_crawl(self):
+        with self._lock:
+            self._deadline = None
+            self._remaining_items = 0
+
+    def item_budget(self):
+        """항목 하나에 쓸 수 있는 시간(초). 크롤링 중이면 남은 시간을 아직 끝나지 않은 항목 수로 나눕니다."""
+        budgets = [self.item_budget_seconds] if self.item_budget_seconds else []
+        with self._lock:
+            if self._deadline is not None:
+                budgets.append(max(0.0, self._deadline - time.perf_counter()) / max(1, self._remaining_items))
+        return min(budgets) if budgets else None
+
+    def plan(self, input_tokens, budget=None):
+        budget = self.item_budget() if budget is None else budget
+        for level in range(len(self.levels)):
+            plan = self._fit(level, input_tokens)
+            # 아직 측정값이 없으면 예산을 판단할 수 없으므로 가장 좋은 단계로 시작
+            if budget is None or self._seconds_per_unit is None or self.estimate(plan, input_tokens) <= budget:
+                break
+        with self._lock:
+            self.level_counts[plan.level] += 1
+        return plan
+
+    def estimate(self, plan, input_tokens):
+        tokens = min(input_tokens, plan.max_input_length)
+        expected_output = (plan.min_output_length + plan.max_output_length) / 2
+        return self._seconds_per_unit * (tokens + self.decode_weight * plan.num_beams * expected_output)
+
+    def observe(self, plan, input_tokens, output_tokens, elapsed):
+        """배치 하나의 실제 소요 시간으로 처리량 추정치를 갱신합니다."""
+        units = sum(input_tokens) + self.decode_weight * plan.num_beams * sum(output_tokens)
+        if units <= 0:
+            return
+        sample = elapsed / units
+        with self._lock:
+            if self._seconds_per_unit is None:
+                self._seconds_per_unit = sample
+            else:
+                self._seconds_per_unit += self.alpha * (sample - self._seconds_per_unit)
+
+    def status(self):
+        budget = self.item_budget()
+        with self._lock:
+            return {
+                "seconds_per_unit": self._seconds_per_unit,
+                "item_budget_seconds": round(budget, 3) if budget is not None else None,
+                "remaining_items": self._remaining_items,
+                "level_counts": list(self.level_counts)
+            }
+
+    def _fit(self, level, input_tokens):
+        base = self.levels[level]
+        tokens = min(input_tokens, base["max_input_length"])
+        # 짧은 입력은 출력도 짧게. length_step 단위로 올려 같은 계획끼리 한 배치로 묶이게 함
+        wanted = max(self.length_step, math.ceil(tokens * self.output_ratio / self.length_step) * self.length_step)
+        max_output = min(base["max_output_length"], wanted)
+        min_output = min(base["min_output_length"], max_output // 2)
+        return DecodingPlan(level, base["num_beams"], base["max_input_length"], max_output, min_output)
@@ -0,0 +1,93 @@
+import struct
+import zlib
+from pathlib import Path
+
+COMBINE_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+MAX_CANVAS_HEIGHT = {"png": 2 ** 31 - 1, "jpeg": 65500, "webp": 16383}
+# JPEG/WebP 인코더는 전체 이미지를 한 번에 받으므로 캔버스 크기를 제한 (RGB 약 120MB)
+MAX_BUFFERED_PIXELS = 40_000_000
+STRIP_ROWS = 64
+
+
+def combine_image_files(image_files, output_path, output_format="png", max_width=None, quality=90):
+    """이미지를 세로로 이어 붙입니다. PNG는 줄 단위로 스트리밍하고, JPEG/WebP는 전체 캔버스를 메모리에 만듭니다."""
+    from PIL import Image
+    if output_format not in COMBINE_FORMATS:
+        raise ValueError(f"지원하지 않는 결합 형식: {output_format}")
+    sizes = []
+    for image_file in image_files:
+        with Image.open(image_file) as img:
+            sizes.append(img.size)
+    width = max(w for w, _ in sizes)
+    if max_width:
+        width = min(width, max_width)
+    layout = [(w, h) if w <= width else (width, max(1, round(h * width / w))) for w, h in sizes]
+    height = sum(h for _, h in layout)
+    if height > MAX_CANVAS_HEIGHT[output_format]:
+        raise ValueError(f"{output_format} 결합 이미지 높이 한도 초과: {height}px")
+    if output_format != "png" and width * height > MAX_BUFFERED_PIXELS:
+        raise ValueError(f"{output_format} 결합 이미지 크기 한도 초과: {width}x{height}px (png를 사용하거나 max_width를 지정하세요)")
+
+    def decoded_pages():
+        for image_file, target_size in zip(image_files, layout):
+            with Image.open(image_file) as img:
+                page = img.convert('RGB')
+            if page.size != target_size:
+                page = page.resize(target_size, Image.LANCZOS)
+            yield page
+            page.close()
+
+    if output_format == "png":
+        _write_png_strips(output_path, width, height, decoded_pages())
+    else:
+        canvas = Image.new('RGB', (width, height))
+        y_offset = 0
+        for page in decoded_pages():
+            canvas.paste(page, (0, y_offset))
+            y_offset += page.height
+        canvas.save(output_path, COMBINE_FORMATS[output_format], quality=quality)
+        canvas.close()
+    return Path(output_path), (width, height)
+
+
+def images_to_pdf(image_files, output_path):
+    """이미지마다 한 페이지인 PDF를 만듭니다. Pillow는 append_images를 모두 모아 두고 쓰므로,
+    한 페이지씩 열어 변환한 뒤 append=True로 이어 써서 메모리에는 한 페이지만 둡니다."""
+    from PIL import Image
+    for index, image_file in enumerate(image_files):
+        with Image.open(image_file) as img:
+            page = img.convert('RGB')
+        try:
+            page.save(output_path, "PDF", append=index > 0, resolution=96)
+        finally:
+            page.close()
+    return Path(output_path)
+
+
+def _png_chunk(f, kind, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
+
+def _write_png_strips(output_path, width, height, pages):
+    compressor = zlib.compressobj(6)
+    with open(output_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        for page in pages:
+            padding = b"\x00" * ((width - page.width) * 3)
+            row_bytes = page.width * 3
+            for top in range(0, page.height, STRIP_ROWS):
+                bottom = min(top + STRIP_ROWS, page.height)
+                strip = page.crop((0, top, page.width, bottom)).tobytes()
+                rows = b"".join(
+                    b"\x00" + strip[i:i + row_bytes] + padding
+                    for i in range(0, len(strip), row_bytes)
+                )
+                data = compressor.compress(rows)
+                if data:
+                    _png_chunk(f, b"IDAT", data)
+        _png_chunk(f, b"IDAT", compressor.flush())
+        _png_chunk(f, b"IEND", b"")
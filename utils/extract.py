@@ -0,0 +1,96 @@
+from io import BytesIO
+from urllib.parse import urljoin
+
+from lxml import etree
+
+GEEKNEWS_ORIGIN = "https://news.hada.io/"
+
+
+def _has_class(element, name):
+    return name in (element.get("class") or "").split()
+
+
+def _first(element, xpath):
+    found = element.xpath(xpath)
+    return found[0] if found else None
+
+
+def _class_xpath(name, tag="*"):
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+def _text(element, separator=""):
+    """BeautifulSoup의 get_text(strip=True)와 같은 규칙으로 텍스트를 모읍니다 (script/style 제외)."""
+    strings = element.xpath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    return separator.join(text.strip() for text in strings if text.strip())
+
+
+def _iter_end(html, tag):
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    return etree.iterparse(
+        BytesIO(html), events=("end",), tag=tag, html=True,
+        encoding="utf-8", remove_comments=True, no_network=True
+    )
+
+
+def parse_topic_row(row, index, base_url=GEEKNEWS_ORIGIN):
+    title_elem = _first(row, _class_xpath("topictitle", "div"))
+    if title_elem is None:
+        return None
+    title_link = _first(title_elem, ".//a")
+    if title_link is None:
+        return None
+
+    title = "".join(title_link.itertext()).strip()
+    original_link = title_link.get("href", "")
+    if original_link and original_link.startswith("/"):
+        original_link = urljoin(base_url, original_link)
+
+    topic_id = None
+    geeknews_link = ""
+    href = _first(row, ".//a/@href[contains(., 'topic?id=')]")
+    if href is not None:
+        topic_id = str(href).split("id=")[-1].split("&")[0]
+        geeknews_link = urljoin(base_url, str(href))
+
+    desc_elem = _first(row, _class_xpath("topicdesc"))
+    desc = "".join(desc_elem.itertext()).strip() if desc_elem is not None else ""
+
+    return {
+        "index": index,
+        "id": topic_id or f"item-{index}",
+        "topic_id": topic_id,
+        "title": title,
+        "desc": desc,
+        "source_url": original_link,
+        "discussion_url": geeknews_link,
+    }
+
+
+def parse_topic_list(html, limit=None, base_url=GEEKNEWS_ORIGIN):
+    """목록 페이지에서 topic_row만 순서대로 읽고, limit개를 채우면 파싱을 멈춥니다."""
+    entries = []
+    if limit is not None and limit <= 0:
+        return entries
+    for _, element in _iter_end(html, "div"):
+        if not _has_class(element, "topic_row"):
+            continue
+        entry = parse_topic_row(element, len(entries), base_url)
+        element.clear(keep_tail=True)
+        if entry:
+            entries.append(entry)
+            if limit is not None and len(entries) >= limit:
+                break
+    return entries
+
+
+def parse_topic_detail(html):
+    """상세 페이지의 topic_contents(없으면 topic_desc) 본문만 꺼내고, 찾는 즉시 파싱을 멈춥니다."""
+    fallback = None
+    for _, element in _iter_end(html, "div"):
+        if _has_class(element, "topic_contents"):
+            return _text(element, separator=" ")
+        if fallback is None and _has_class(element, "topic_desc"):
+            fallback = _text(element)
+    return fallback or ""
@@ -0,0 +1,53 @@
+import hashlib
+import json
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+# server.py의 GZipMiddleware 기준 크기. 이 크기 이상인 응답은 gzip 표현으로 나가므로 ETag도 달라야 함
+GZIP_MINIMUM_SIZE = 1024
+
+
+def encode_json(payload):
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def make_etag(body):
+    return f'"{hashlib.sha256(body).hexdigest()[:40]}"'
+
+
+def representation_etag(request, body, etag):
+    """GZipMiddleware가 압축해 보낼 응답이면 ETag에 -gzip을 붙여 표현마다 다른 강한 검증자를 씁니다."""
+    if len(body) >= GZIP_MINIMUM_SIZE and "gzip" in request.headers.get("accept-encoding", ""):
+        return f'{etag[:-1]}-gzip"'
+    return etag
+
+
+def _opaque_tag(tag):
+    # If-None-Match는 약한 비교를 쓰므로 W/ 접두사를 떼고 비교 (RFC 9110 13.1.2)
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request, etag, last_modified=None):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [_opaque_tag(candidate.strip()) for candidate in if_none_match.split(",")]
+        return "*" in candidates or _opaque_tag(etag) in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def conditional_response(request: Request, body: bytes, etag=None, last_modified=None, headers=None):
+    etag = representation_etag(request, body, etag or make_etag(body))
+    response_headers = {"ETag": etag, "Cache-Control": "no-cache", **(headers or {})}
+    if last_modified:
+        response_headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=response_headers)
+    return Response(content=body, media_type="application/json", headers=response_headers)
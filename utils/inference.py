@@ -0,0 +1,158 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class InferenceExecutor:
+    def __init__(self, batch_fn, max_batch_size=8, max_wait_ms=20, max_queue_size=64, submit_timeout=60, name="inference"):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self.submit_timeout = submit_timeout
+        self.name = name
+        self._queue = queue.Queue(maxsize=max(1, max_queue_size))
+        self._deferred = deque()  # 다른 그룹이라 이번 배치에 넣지 못한 항목 (워커 스레드 전용)
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=256)
+        self._queue_waits = deque(maxlen=256)
+        self._counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "batches": 0,
+            "batched_items": 0,
+            "max_queue_depth": 0,
+        }
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-worker", daemon=True)
+        self._thread.start()
+        print(f"[INFERENCE] 워커 시작: batch={self.max_batch_size}, wait={self.max_wait * 1000:.0f}ms, queue={self._queue.maxsize}")
+
+    def shutdown(self, timeout=5):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        while True:
+            try:
+                _, future, _, _ = self._deferred.popleft() if self._deferred else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if not future.done():
+                future.set_exception(RuntimeError("추론 실행기가 종료되었습니다"))
+        print("[INFERENCE] 워커 종료")
+
+    async def submit(self, text, group=None):
+        """group이 같은 항목끼리만 한 배치로 묶고, group이 있으면 batch_fn(texts, group)으로 호출합니다."""
+        self.start()
+        future = Future()
+        item = (text, future, time.perf_counter(), group)
+        deadline = time.monotonic() + self.submit_timeout
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                break
+            except queue.Full:
+                if time.monotonic() >= deadline:
+                    with self._lock:
+                        self._counters["rejected"] += 1
+                    raise TimeoutError("추론 대기열이 가득 찼습니다")
+                await asyncio.sleep(0.05)
+        with self._lock:
+            self._counters["submitted"] += 1
+            self._counters["max_queue_depth"] = max(self._counters["max_queue_depth"], self._queue.qsize())
+        return await asyncio.wrap_future(future)
+
+    def stats(self):
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = sorted(self._latencies)
+            queue_waits = sorted(self._queue_waits)
+        return {
+            **counters,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "queue_depth": self._queue.qsize() + len(self._deferred),
+            "queue_capacity": self._queue.maxsize,
+            "avg_batch_size": round(counters["batched_items"] / counters["batches"], 2) if counters["batches"] else 0,
+            "latency_ms": _summarize_latencies(latencies),
+            "queue_wait_ms": _summarize_latencies(queue_waits),
+        }
+
+    def _collect_batch(self):
+        if self._deferred:
+            first = self._deferred.popleft()
+        else:
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                return []
+        group = first[3]
+        batch = [first]
+        for item in list(self._deferred):
+            if len(batch) >= self.max_batch_size:
+                break
+            if item[3] == group:
+                self._deferred.remove(item)
+                batch.append(item)
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[3] == group:
+                batch.append(item)
+            else:
+                self._deferred.append(item)
+        return batch
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = [item for item in self._collect_batch() if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            started = time.perf_counter()
+            group = batch[0][3]
+            texts = [item[0] for item in batch]
+            try:
+                results = self.batch_fn(texts) if group is None else self.batch_fn(texts, group)
+                if len(results) != len(batch):
+                    raise RuntimeError(f"배치 결과 개수 불일치: {len(results)} != {len(batch)}")
+                error = None
+            except Exception as e:
+                results = None
+                error = e
+            finished = time.perf_counter()
+            with self._lock:
+                self._counters["batches"] += 1
+                self._counters["batched_items"] += len(batch)
+                self._counters["completed" if error is None else "failed"] += len(batch)
+                for _, _, enqueued, _ in batch:
+                    self._queue_waits.append((started - enqueued) * 1000)
+                    self._latencies.append((finished - enqueued) * 1000)
+            for index, (_, future, _, _) in enumerate(batch):
+                if error is None:
+                    future.set_result(results[index])
+                else:
+                    future.set_exception(error)
+
+
+def _summarize_latencies(values):
+    if not values:
+        return {"avg": 0, "p50": 0, "p95": 0, "max": 0}
+    return {
+        "avg": round(sum(values) / len(values), 1),
+        "p50": round(values[len(values) // 2], 1),
+        "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+        "max": round(values[-1], 1),
+    }
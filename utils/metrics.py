@@ -0,0 +1,209 @@
+import asyncio
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블이 맞지 않습니다 ({sorted(labels)} != {sorted(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value):
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            state["buckets"][bisect.bisect_left(self.buckets, value)] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self, key, state):
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state["buckets"]):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Prometheus 텍스트 형식(0.0.4)으로 내보내는 간단한 메트릭 저장소입니다."""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+CRAWL_SECONDS = REGISTRY.histogram(
+    "geeknews_crawl_duration_seconds", "fetch_news 한 번의 전체 소요 시간",
+    ["api_type", "outcome"], buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+)
+CRAWL_ITEMS = REGISTRY.counter(
+    "geeknews_crawl_items_total", "크롤링한 토픽 수 (재사용 여부별)", ["api_type", "source"]
+)
+HTTP_FETCH_SECONDS = REGISTRY.histogram(
+    "geeknews_http_fetch_duration_seconds", "GeekNews 페이지 요청 지연 시간 (재시도 포함)", ["page"]
+)
+SUMMARIZE_SECONDS = REGISTRY.histogram(
+    "geeknews_summarize_duration_seconds", "토픽 하나의 요약 지연 시간 (대기열 대기 포함)",
+    ["api_type"], buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+)
+SUMMARY_TOKENS = REGISTRY.histogram(
+    "geeknews_summary_tokens", "요약 입력/출력 토큰 수", ["api_type", "direction"],
+    buckets=(16, 32, 64, 128, 256, 512, 1024, 2048)
+)
+SUMMARY_DECODING_LEVELS = REGISTRY.counter(
+    "geeknews_summary_decoding_levels_total", "적응형 디코딩이 고른 단계 (0이 최고 품질)", ["level", "num_beams"]
+)
+SUMMARY_CACHE_REQUESTS = REGISTRY.counter(
+    "geeknews_summary_cache_requests_total", "요약 캐시 조회 결과", ["result"]
+)
+NEWS_CACHE_REQUESTS = REGISTRY.counter(
+    "geeknews_news_cache_requests_total", "/api/news 응답이 나온 캐시 계층 (memory, volume, stale, fresh)", ["tier"]
+)
+EXPORT_RENDER_SECONDS = REGISTRY.histogram(
+    "geeknews_export_render_duration_seconds", "내보내기 페이지 하나의 렌더링 시간", ["format", "method", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+EXPORT_CACHE_REQUESTS = REGISTRY.counter(
+    "geeknews_export_cache_requests_total", "내보내기 렌더링 캐시 조회 결과", ["result"]
+)
+SCHEDULER_JOBS = REGISTRY.counter(
+    "geeknews_scheduler_jobs_total", "예약 작업 실행 결과", ["job", "outcome"]
+)
+SCHEDULER_JOB_SECONDS = REGISTRY.histogram(
+    "geeknews_scheduler_job_duration_seconds", "예약 작업 소요 시간", ["job"],
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800)
+)
+EVENT_LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "geeknews_event_loop_lag_seconds", "이벤트 루프 지연 (예정 시각 대비 늦게 깨어난 시간)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+)
+EVENT_LOOP_LAG_LAST = REGISTRY.gauge(
+    "geeknews_event_loop_lag_last_seconds", "가장 최근에 측정한 이벤트 루프 지연"
+)
+INFERENCE_QUEUE_DEPTH = REGISTRY.gauge(
+    "geeknews_inference_queue_depth", "추론 대기열에 쌓인 요청 수", ["api_type"]
+)
+NEWS_CACHE_AGE = REGISTRY.gauge(
+    "geeknews_news_cache_age_seconds", "메모리 뉴스 캐시가 마지막으로 갱신된 뒤 지난 시간"
+)
+
+
+async def monitor_event_loop_lag(interval=0.5):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.perf_counter() - started - interval)
+        EVENT_LOOP_LAG_SECONDS.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
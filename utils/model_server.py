@@ -0,0 +1,101 @@
+"""요약 모델을 한 번만 올려 여러 API 워커가 함께 쓰는 추론 사이드카입니다.
+
+    python -m utils.model_server --port 8001
+    python -m utils.model_server --uds /tmp/geeknews-inference.sock
+
+API 워커는 INFERENCE_SERVER_URL(또는 AI_CONFIG["inference_url"])에
+http://127.0.0.1:8001 이나 unix:///tmp/geeknews-inference.sock 을 지정하면 이 서버로 요약을 요청합니다.
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from config import AI_CONFIG
+from generator import NewsFetcher
+from utils.metrics import REGISTRY
+
+app = FastAPI()
+fetcher = NewsFetcher(api_type="huggingface", inference_url="", use_summary_cache=False)
+# 대기열 하나로 여러 워커의 요청을 받으므로 한 번에 받을 수 있는 텍스트 수를 대기열 길이로 제한
+MAX_TEXTS_PER_REQUEST = AI_CONFIG["queue_size"]
+
+
+class SummarizeRequest(BaseModel):
+    texts: List[str]
+    budget_seconds: Optional[float] = None  # 항목당 시간 예산 (적응형 디코딩을 켠 경우에만 사용)
+
+
+async def load_model():
+    try:
+        await fetcher.warm_up()
+        print(f"[MODEL SERVER] 모델 준비 완료: {fetcher.load_timings}")
+    except Exception as e:
+        print(f"[ERROR] 모델 로딩 실패: {e}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    app.state.load_task = asyncio.create_task(load_model())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await fetcher.aclose()
+
+
+@app.get("/health")
+async def health():
+    status = fetcher.warmup_status()
+    body = {
+        "state": status["state"],
+        "error": status["error"],
+        "model": AI_CONFIG["model_name"],
+        "quantization": AI_CONFIG["quantization"],
+        "timings": status["timings"],
+        "inference": fetcher.inference_stats(),
+        "pid": os.getpid()
+    }
+    return JSONResponse(body, status_code=200 if status["state"] == "ready" else 503)
+
+
+@app.post("/summarize")
+async def summarize(request: SummarizeRequest):
+    """요약할 텍스트 목록을 받아 같은 순서로 요약과 디코딩 단계를 돌려줍니다. 동시에 들어온 요청은 추론 대기열에서 함께 배치됩니다."""
+    if not request.texts:
+        return {"summaries": [], "levels": [], "elapsed_ms": 0}
+    if len(request.texts) > MAX_TEXTS_PER_REQUEST:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {MAX_TEXTS_PER_REQUEST}개까지 요약할 수 있습니다")
+    started = time.perf_counter()
+    try:
+        summaries, levels = await fetcher.summarize_batch(request.texts, request.budget_seconds)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"모델을 사용할 수 없습니다: {e}")
+    return {"summaries": summaries, "levels": levels, "elapsed_ms": round((time.perf_counter() - started) * 1000)}
+
+
+@app.get("/metrics")
+async def metrics():
+    return Response(REGISTRY.render(), media_type=REGISTRY.content_type)
+
+
+def main():
+    import uvicorn
+    parser = argparse.ArgumentParser(description="요약 모델 사이드카 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("INFERENCE_SERVER_PORT", 8001)))
+    parser.add_argument("--uds", help="TCP 대신 사용할 유닉스 소켓 경로")
+    args = parser.parse_args()
+    if args.uds:
+        uvicorn.run(app, uds=args.uds)
+    else:
+        uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 단일 워커로 동작
+    fcntl = None
+
+
+class ProcessLock:
+    """flock 기반 프로세스 간 잠금입니다. 잡고 있던 프로세스가 죽으면 커널이 잠금을 풀어 줍니다."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = None
+
+    @property
+    def held(self):
+        return self._fd is not None
+
+    def try_acquire(self):
+        if self._fd is not None:
+            return False
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        # 잠금을 놓기 전에 pid를 지워 holder_pid()가 풀린 잠금의 워커를 가리키지 않게 함
+        os.ftruncate(fd, 0)
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    @asynccontextmanager
+    async def hold(self, poll_interval=0.2):
+        waited = False
+        while not self.try_acquire():
+            waited = True
+            await asyncio.sleep(poll_interval)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    def holder_pid(self):
+        try:
+            content = self.path.read_text().strip()
+            return int(content) if content else None
+        except (OSError, ValueError):
+            return None
+
+    def status(self):
+        return {"path": str(self.path), "held": self.held, "holder_pid": self.holder_pid(), "pid": os.getpid()}
@@ -0,0 +1,35 @@
+import asyncio
+
+
+class ProgressLog:
+    """크롤링 진행 이벤트를 순서대로 모아 두고, 구독자는 처음부터 따라 읽습니다."""
+
+    def __init__(self):
+        self.events = []
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def append(self, event, data=None):
+        if self.closed:
+            return
+        self.events.append((event, data or {}))
+        self._notify()
+
+    def close(self):
+        self.closed = True
+        self._notify()
+
+    async def follow(self):
+        index = 0
+        while True:
+            while index < len(self.events):
+                yield self.events[index]
+                index += 1
+            if self.closed:
+                return
+            changed = self._changed
+            await changed.wait()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class RenderCache:
+    """HTML, 형식, 렌더링 설정의 해시로 이미 만든 내보내기 결과 파일을 찾습니다. 용량과 보관 기간을 넘으면 오래 쓰지 않은 것부터 파일과 함께 삭제합니다."""
+
+    def __init__(self, path, artifact_dir, max_bytes=500 * 1024 * 1024, max_age_seconds=7 * 86400):
+        self.path = Path(path)
+        self.artifact_dir = Path(artifact_dir)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS renders ("
+            "key TEXT PRIMARY KEY, filename TEXT, format TEXT, size INTEGER, "
+            "created_at REAL, accessed_at REAL, hits INTEGER DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_renders_accessed ON renders (accessed_at)")
+        self._conn.commit()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(html_content, export_format, settings):
+        html_hash = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+        payload = json.dumps([html_hash, export_format, settings], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT filename, format, created_at FROM renders WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and (now - row[2] > self.max_age_seconds or not (self.artifact_dir / row[0]).is_file()):
+                self._delete([(key, row[0])])
+                row = None
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE renders SET accessed_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.stats["hits"] += 1
+            return {"filename": row[0], "format": row[1]}
+
+    def put(self, key, filename, export_format):
+        now = time.time()
+        size = (self.artifact_dir / filename).stat().st_size
+        with self._lock:
+            # 다른 워커가 같은 페이지를 먼저 등록했다면 그 기록을 계속 사용 (파일 이름이 키 기준이라 내용은 같음)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO renders (key, filename, format, size, created_at, accessed_at, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, filename, export_format, size, now, now)
+            )
+            self._evict(now, keep=key)
+            self._conn.commit()
+            self.stats["stores"] += 1
+
+    def _evict(self, now, keep=None):
+        expired = self._conn.execute(
+            "SELECT key, filename FROM renders WHERE created_at < ?", (now - self.max_age_seconds,)
+        ).fetchall()
+        self._delete(expired)
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM renders").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, filename, size in self._conn.execute("SELECT key, filename, size FROM renders ORDER BY accessed_at ASC"):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            victims.append((key, filename))
+            total -= size or 0
+        self._delete(victims)
+
+    def _delete(self, rows):
+        for key, filename in rows:
+            self._conn.execute("DELETE FROM renders WHERE key = ?", (key,))
+            (self.artifact_dir / filename).unlink(missing_ok=True)
+        if rows:
+            self._conn.commit()
+            self.stats["evictions"] += len(rows)
+
+    def info(self):
+        with self._lock:
+            entries, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM renders").fetchone()
+        return {
+            **self.stats,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "max_age_seconds": self.max_age_seconds,
+            "path": str(self.path)
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
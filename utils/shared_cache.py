@@ -0,0 +1,67 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SharedNewsCache:
+    """여러 워커 프로세스가 같은 뉴스 캐시를 보도록 SQLite 파일에 저장합니다. version이 바뀐 경우에만 다시 읽습니다."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS news_cache ("
+            "key TEXT PRIMARY KEY, version INTEGER, news TEXT, last_updated REAL, "
+            "last_crawled_date TEXT, crawled_at REAL)"
+        )
+        self._conn.commit()
+        self.stats = {"loads": 0, "stores": 0}
+
+    def version(self, key="news"):
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM news_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def load(self, key="news"):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, news, last_updated, last_crawled_date, crawled_at FROM news_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        self.stats["loads"] += 1
+        return {
+            "version": row[0],
+            "news": json.loads(row[1]),
+            "last_updated": row[2],
+            "last_crawled_date": row[3],
+            "crawled_at": row[4]
+        }
+
+    def store(self, news, last_updated, last_crawled_date, crawled_at, key="news"):
+        body = json.dumps(news, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO news_cache (key, version, news, last_updated, last_crawled_date, crawled_at) "
+                "VALUES (?, 1, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET version = version + 1, news = excluded.news, "
+                "last_updated = excluded.last_updated, last_crawled_date = excluded.last_crawled_date, "
+                "crawled_at = excluded.crawled_at",
+                (key, body, last_updated, last_crawled_date, crawled_at)
+            )
+            self._conn.commit()
+            version = self._conn.execute("SELECT version FROM news_cache WHERE key = ?", (key,)).fetchone()[0]
+        self.stats["stores"] += 1
+        return version
+
+    def info(self):
+        return {**self.stats, "version": self.version(), "path": str(self.path)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
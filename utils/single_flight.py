@@ -0,0 +1,32 @@
+import asyncio
+
+
+class SingleFlight:
+    def __init__(self, name="single-flight"):
+        self.name = name
+        self._inflight = {}
+        self.stats = {"started": 0, "joined": 0}
+
+    def running(self, key):
+        return key in self._inflight
+
+    async def do(self, key, fn):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats["started"] += 1
+        else:
+            self.stats["joined"] += 1
+            print(f"[{self.name}] 진행 중인 작업에 합류: {key}")
+        return await asyncio.shield(task)
+
+    def status(self):
+        return {**self.stats, "running": sorted(self._inflight)}
+
+    def _forget(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,161 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+SNAPSHOT_SUFFIX = ".json.gz"
+ITEMS_REF = "$items"
+# 스냅샷마다 거의 같은 뉴스 목록이 들어 있는 위치 (한 번만 저장하고 해시로 참조)
+ITEM_LIST_PATHS = (("news_items",), ("news_data", "items"), ("news_data", "news_items"))
+
+
+class SnapshotStore:
+    """data/saved_states 스냅샷을 gzip으로 압축해 저장하고, 뉴스 항목은 내용 해시로 한 번만 저장합니다.
+
+    읽을 때는 참조를 원래 목록으로 되돌리므로 호출하는 쪽은 예전 .json 파일과 구분할 필요가 없습니다.
+    """
+
+    def __init__(self, data_dir, db_name="items.sqlite3", compresslevel=6):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.data_dir / db_name), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS items (hash TEXT PRIMARY KEY, body TEXT, created_at REAL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS item_refs (filename TEXT, hash TEXT, PRIMARY KEY (filename, hash))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_item_refs_hash ON item_refs (hash)")
+        self._conn.commit()
+        self.stats = {"writes": 0, "reads": 0, "items_stored": 0, "items_reused": 0, "deleted": 0}
+
+    @staticmethod
+    def filename(kind, timestamp):
+        return f"{kind}_{timestamp}{SNAPSHOT_SUFFIX}"
+
+    @staticmethod
+    def item_hash(item):
+        body = json.dumps(item, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()[:32], body
+
+    def write(self, filename, data):
+        """스냅샷을 저장하고 파일 크기(바이트)를 반환합니다. 항목을 먼저 저장한 뒤 파일을 바꿔 넣습니다."""
+        stored = dict(data)
+        items = {}
+        for path in ITEM_LIST_PATHS:
+            container = stored
+            for key in path[:-1]:
+                if not isinstance(container.get(key), dict):
+                    container = None
+                    break
+                child = dict(container[key])
+                container[key] = child
+                container = child
+            value = container.get(path[-1]) if container is not None else None
+            if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+                continue
+            hashes = []
+            for item in value:
+                item_hash, body = self.item_hash(item)
+                items[item_hash] = body
+                hashes.append(item_hash)
+            container[path[-1]] = {ITEMS_REF: hashes}
+
+        now = time.time()
+        with self._lock:
+            # 같은 초에 저장해 파일 이름이 같으면 이전 버전의 참조를 지워야 그 항목이 정리 대상이 됨
+            self._conn.execute("DELETE FROM item_refs WHERE filename = ?", (filename,))
+            existing = self._existing(list(items)) if items else set()
+            if items:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO items (hash, body, created_at) VALUES (?, ?, ?)",
+                    [(item_hash, body, now) for item_hash, body in items.items()]
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO item_refs (filename, hash) VALUES (?, ?)",
+                    [(filename, item_hash) for item_hash in items]
+                )
+            self._conn.commit()
+        self.stats["items_reused"] += len(existing)
+        self.stats["items_stored"] += len(items) - len(existing)
+
+        content = gzip.compress(
+            json.dumps(stored, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            compresslevel=self.compresslevel
+        )
+        path = self.data_dir / filename
+        temp = path.with_name(f".{filename}.tmp")
+        temp.write_bytes(content)
+        os.replace(temp, path)
+        self.stats["writes"] += 1
+        return len(content)
+
+    def read(self, path):
+        path = Path(path)
+        if path.name.endswith(".gz"):
+            data = json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        self._resolve(data)
+        self.stats["reads"] += 1
+        return data
+
+    def delete(self, filename):
+        (self.data_dir / filename).unlink(missing_ok=True)
+        with self._lock:
+            self._conn.execute("DELETE FROM item_refs WHERE filename = ?", (filename,))
+            self._conn.commit()
+        self.stats["deleted"] += 1
+
+    def collect_garbage(self):
+        """어떤 스냅샷도 참조하지 않는 항목을 지웁니다."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM items WHERE hash NOT IN (SELECT hash FROM item_refs)"
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def info(self):
+        with self._lock:
+            items = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        return {**self.stats, "items": items}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _existing(self, hashes):
+        placeholders = ", ".join("?" for _ in hashes)
+        return {
+            row[0] for row in
+            self._conn.execute(f"SELECT hash FROM items WHERE hash IN ({placeholders})", hashes)
+        }
+
+    def _resolve(self, data):
+        refs = []
+        for path in ITEM_LIST_PATHS:
+            container = data
+            for key in path[:-1]:
+                container = container.get(key) if isinstance(container, dict) else None
+            value = container.get(path[-1]) if isinstance(container, dict) else None
+            if isinstance(value, dict) and ITEMS_REF in value:
+                refs.append((container, path[-1], value[ITEMS_REF]))
+        if not refs:
+            return
+        hashes = list({item_hash for _, _, item_hashes in refs for item_hash in item_hashes})
+        placeholders = ", ".join("?" for _ in hashes)
+        with self._lock:
+            bodies = dict(self._conn.execute(
+                f"SELECT hash, body FROM items WHERE hash IN ({placeholders})", hashes
+            ).fetchall())
+        missing = [item_hash for item_hash in hashes if item_hash not in bodies]
+        if missing:
+            raise ValueError(f"스냅샷이 참조하는 뉴스 항목이 없습니다: {missing[:3]}")
+        for container, key, item_hashes in refs:
+            container[key] = [json.loads(bodies[item_hash]) for item_hash in item_hashes]
@@ -0,0 +1,109 @@
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+SNAPSHOT_PATTERN = re.compile(r"^(state|auto_crawled|manual_refresh)_(\d{8})_(\d{6})\.json(?:\.gz)?$")
+
+
+class StateIndex:
+    def __init__(self, data_dir, db_name="index.sqlite3"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.data_dir / db_name), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "filename TEXT PRIMARY KEY, kind TEXT NOT NULL, date TEXT NOT NULL, stamp TEXT NOT NULL, "
+            "saved_at TEXT, crawled_at TEXT, version TEXT, news_count INTEGER, size INTEGER)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_kind ON snapshots (kind, stamp)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots (date, kind, stamp)")
+        self._conn.commit()
+
+    @staticmethod
+    def parse_filename(filename):
+        match = SNAPSHOT_PATTERN.match(filename)
+        if not match:
+            return None
+        kind, date, clock = match.groups()
+        return kind, date, clock
+
+    def record(self, filename, data, size=None):
+        parsed = self.parse_filename(filename)
+        if not parsed:
+            return False
+        kind, date, clock = parsed
+        saved_at = data.get("saved_at") or f"{date[:4]}-{date[4:6]}-{date[6:]}T{clock[:2]}:{clock[2:4]}:{clock[4:]}"
+        news_items = data.get("news_items")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(filename, kind, date, stamp, saved_at, crawled_at, version, news_count, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    filename, kind, date, date + clock, saved_at, data.get("crawled_at"), data.get("version", "1.0"),
+                    data.get("news_count", len(news_items) if isinstance(news_items, list) else None), size
+                )
+            )
+            self._conn.commit()
+        return True
+
+    def remove(self, filename):
+        with self._lock:
+            self._conn.execute("DELETE FROM snapshots WHERE filename = ?", (filename,))
+            self._conn.commit()
+
+    def list(self, kinds=None, date=None, limit=20, offset=0):
+        where, params = self._filters(kinds, date)
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM snapshots{where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM snapshots{where} ORDER BY stamp DESC, filename DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def latest(self, kinds=None, date=None):
+        rows, _ = self.list(kinds, date, limit=1)
+        return rows[0] if rows else None
+
+    def sync(self, loader=None):
+        on_disk = {
+            entry.name: entry for entry in self.data_dir.iterdir()
+            if entry.is_file() and self.parse_filename(entry.name)
+        }
+        with self._lock:
+            indexed = {row[0] for row in self._conn.execute("SELECT filename FROM snapshots")}
+        for filename in indexed - on_disk.keys():
+            self.remove(filename)
+        added = 0
+        for filename in on_disk.keys() - indexed:
+            path = on_disk[filename]
+            try:
+                data = loader(path) if loader else json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"[INDEX] 색인 실패, 건너뜀: {filename} ({e})")
+                continue
+            self.record(filename, data, path.stat().st_size)
+            added += 1
+        return {"added": added, "removed": len(indexed - on_disk.keys()), "total": len(on_disk)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _filters(kinds, date):
+        clauses = []
+        params = []
+        if kinds:
+            clauses.append(f"kind IN ({', '.join('?' for _ in kinds)})")
+            params.extend(kinds)
+        if date:
+            clauses.append("date = ?")
+            params.append(date)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
@@ -0,0 +1,175 @@
+import copy
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class RevisionConflict(Exception):
+    def __init__(self, head):
+        super().__init__(f"기준 revision이 최신이 아닙니다 (최신: {head})")
+        self.head = head
+
+
+class RevisionUnavailable(LookupError):
+    pass
+
+
+def merge_patch(target, patch):
+    """JSON Merge Patch (RFC 7386): 객체는 재귀적으로 합치고, null은 키를 지우며, 그 밖의 값은 통째로 바꿉니다."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+class StateLog:
+    """편집 상태의 revision 기록입니다.
+
+    전체 저장은 스냅샷 파일을, 부분 저장은 merge patch를 한 줄씩 추가합니다. 어떤 revision이든
+    그 이전의 가장 가까운 스냅샷(체크포인트)에서 시작해 patch를 차례로 적용해 다시 만듭니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS revisions ("
+            "revision INTEGER PRIMARY KEY AUTOINCREMENT, base_revision INTEGER, patch TEXT, "
+            "filename TEXT, saved_at TEXT, size INTEGER)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_revisions_filename ON revisions (filename)")
+        self._cached = None  # (revision, 상태) - revision은 바뀌지 않으므로 그대로 재사용 가능
+        self.stats = {"full_saves": 0, "patches": 0, "rebuilds": 0, "cache_hits": 0, "checkpoints": 0, "trimmed": 0}
+
+    def head(self):
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(revision) FROM revisions").fetchone()
+        return row[0] or 0
+
+    def append_full(self, filename, saved_at, data=None):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            # 같은 초에 저장해 파일이 덮어써졌다면 이전 revision은 더 이상 그 파일로 만들 수 없음
+            self._conn.execute("UPDATE revisions SET filename = NULL WHERE filename = ?", (filename,))
+            revision = self._conn.execute(
+                "INSERT INTO revisions (base_revision, patch, filename, saved_at, size) VALUES (NULL, NULL, ?, ?, NULL)",
+                (filename, saved_at)
+            ).lastrowid
+            self._conn.execute("COMMIT")
+        if data is not None:
+            self._cached = (revision, copy.deepcopy(data))
+        self.stats["full_saves"] += 1
+        return revision
+
+    def append_patch(self, base_revision, patch, saved_at, data=None):
+        """base_revision이 최신일 때만 patch를 추가하고 새 revision을 반환합니다. data는 적용 결과(캐시용)입니다."""
+        body = json.dumps(patch, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            head = self._conn.execute("SELECT MAX(revision) FROM revisions").fetchone()[0] or 0
+            if head != base_revision:
+                self._conn.execute("ROLLBACK")
+                raise RevisionConflict(head)
+            revision = self._conn.execute(
+                "INSERT INTO revisions (base_revision, patch, filename, saved_at, size) VALUES (?, ?, NULL, ?, ?)",
+                (base_revision, body, saved_at, len(body.encode("utf-8")))
+            ).lastrowid
+            self._conn.execute("COMMIT")
+        if data is not None:
+            self._cached = (revision, copy.deepcopy(data))
+        self.stats["patches"] += 1
+        return revision
+
+    def rebuild(self, revision, loader):
+        """revision의 전체 상태를 만듭니다. loader(filename)는 체크포인트 스냅샷을 읽어 dict로 돌려줍니다."""
+        cached = self._cached
+        if cached and cached[0] == revision:
+            self.stats["cache_hits"] += 1
+            return copy.deepcopy(cached[1])
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM revisions WHERE revision = ?", (revision,)).fetchone()
+            checkpoints = self._conn.execute(
+                "SELECT revision, filename FROM revisions WHERE revision <= ? AND filename IS NOT NULL "
+                "ORDER BY revision DESC", (revision,)
+            ).fetchall()
+        if not exists:
+            raise RevisionUnavailable(f"revision {revision}이(가) 없습니다")
+        for checkpoint, filename in checkpoints:
+            try:
+                state = loader(filename)
+            except FileNotFoundError:
+                continue
+            with self._lock:
+                patches = self._conn.execute(
+                    "SELECT revision, patch FROM revisions WHERE revision > ? AND revision <= ? ORDER BY revision",
+                    (checkpoint, revision)
+                ).fetchall()
+            for patch_revision, patch in patches:
+                if patch is None:
+                    raise RevisionUnavailable(f"revision {patch_revision}의 스냅샷이 삭제되어 {revision}을(를) 만들 수 없습니다")
+                state = merge_patch(state, json.loads(patch))
+            self._cached = (revision, copy.deepcopy(state))
+            self.stats["rebuilds"] += 1
+            return state
+        raise RevisionUnavailable(f"revision {revision}의 기준 스냅샷이 남아 있지 않습니다")
+
+    def revision_for(self, filename):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(revision) FROM revisions WHERE filename = ?", (filename,)
+            ).fetchone()
+        return row[0]
+
+    def filename_for(self, revision):
+        """revision이 전체 저장(체크포인트)이면 그 스냅샷 파일 이름, patch면 None"""
+        with self._lock:
+            row = self._conn.execute("SELECT filename FROM revisions WHERE revision = ?", (revision,)).fetchone()
+        return row[0] if row else None
+
+    def pending(self):
+        """마지막 체크포인트 이후 쌓인 patch 수와 바이트 수"""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM revisions WHERE revision > "
+                "COALESCE((SELECT MAX(revision) FROM revisions WHERE filename IS NOT NULL), 0)"
+            ).fetchone()
+        return count, size
+
+    def mark_checkpoint(self, revision, filename):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("UPDATE revisions SET filename = NULL WHERE filename = ?", (filename,))
+            self._conn.execute("UPDATE revisions SET filename = ? WHERE revision = ?", (filename, revision))
+            self._conn.execute("COMMIT")
+        self.stats["checkpoints"] += 1
+
+    def forget_checkpoint(self, filename):
+        with self._lock:
+            self._conn.execute("UPDATE revisions SET filename = NULL WHERE filename = ?", (filename,))
+
+    def trim(self):
+        """가장 오래 남아 있는 체크포인트보다 앞선 기록은 다시 만들 수 없으므로 지웁니다."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM revisions WHERE revision < "
+                "(SELECT MIN(revision) FROM revisions WHERE filename IS NOT NULL)"
+            ).rowcount
+        self.stats["trimmed"] += removed
+        return removed
+
+    def info(self):
+        count, size = self.pending()
+        return {**self.stats, "head": self.head(), "pending_patches": count, "pending_bytes": size}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
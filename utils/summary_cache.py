@@ -0,0 +1,69 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+class SummaryCache:
+    def __init__(self, path, max_entries=2000):
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, topic_id TEXT, text_hash TEXT, summary TEXT, "
+            "created_at REAL, accessed_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries (accessed_at)")
+        self._conn.commit()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(topic_id, text, signature):
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        payload = json.dumps([topic_id or "", text_hash, signature], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest(), text_hash
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.stats["hits"] += 1
+            return row[0]
+
+    def put(self, key, topic_id, text_hash, summary):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, topic_id, text_hash, summary, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, topic_id, text_hash, summary, now, now)
+            )
+            overflow = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM summaries WHERE key IN "
+                    "(SELECT key FROM summaries ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self.stats["evictions"] += overflow
+            self._conn.commit()
+            self.stats["stores"] += 1
+
+    def info(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        return {**self.stats, "entries": entries, "max_entries": self.max_entries, "path": str(self.path)}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()